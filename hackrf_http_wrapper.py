@@ -5,12 +5,17 @@ A simple HTTP server that proxies requests to the HackRF UDP server,
 enabling curl and other HTTP clients to interact with the system.
 """
 
-import asyncio
+import concurrent.futures
+import functools
 import json
+import os
+import queue
+import re
+import selectors
 import socket
 import time
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import parse_qs
 import threading
 import logging
 
@@ -18,111 +23,7 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class HackRFHTTPHandler(BaseHTTPRequestHandler):
-    """HTTP handler that proxies requests to HackRF UDP server"""
-
-    def __init__(self, *args, **kwargs):
-        self.udp_host = kwargs.pop("udp_host", "localhost")
-        self.udp_port = kwargs.pop("udp_port", 5000)
-        super().__init__(*args, **kwargs)
-
-    def log_message(self, format, *args):
-        """Override to use our logger"""
-        logger.info(f"{self.address_string()} - {format % args}")
-
-    def do_GET(self):
-        """Handle GET requests"""
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
-        query_params = parse_qs(parsed_path.query)
-
-        try:
-            if path == "/":
-                self._serve_help_page()
-            elif path == "/connect":
-                self._handle_connect()
-            elif path == "/stats":
-                self._handle_stats()
-            elif path == "/ping":
-                self._handle_ping()
-            elif path == "/disconnect":
-                self._handle_disconnect()
-            elif path == "/scan/fm":
-                self._handle_fm_scan(query_params)
-            elif path == "/scan/custom":
-                self._handle_custom_scan(query_params)
-            else:
-                self._send_error(404, "Endpoint not found")
-
-        except Exception as e:
-            logger.error(f"Error handling GET {path}: {e}")
-            self._send_error(500, f"Server error: {str(e)}")
-
-    def do_POST(self):
-        """Handle POST requests"""
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
-
-        try:
-            content_length = int(self.headers.get("Content-Length", 0))
-            post_data = self.rfile.read(content_length)
-
-            if path == "/start_stream":
-                self._handle_start_stream(post_data)
-            elif path == "/stop_stream":
-                self._handle_stop_stream()
-            else:
-                self._send_error(404, "Endpoint not found")
-
-        except Exception as e:
-            logger.error(f"Error handling POST {path}: {e}")
-            self._send_error(500, f"Server error: {str(e)}")
-
-    def _send_udp_command(self, command, timeout=5):
-        """Send command to UDP server and get response"""
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.settimeout(timeout)
-
-            sock.sendto(command.encode("utf-8"), (self.udp_host, self.udp_port))
-            response, addr = sock.recvfrom(4096)
-
-            sock.close()
-            return response.decode("utf-8", errors="ignore")
-
-        except Exception as e:
-            raise Exception(f"UDP communication failed: {str(e)}")
-
-    def _send_json_response(self, data, status=200):
-        """Send JSON response"""
-        response_data = json.dumps(data, indent=2)
-
-        self.send_response(status)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(response_data)))
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.end_headers()
-
-        self.wfile.write(response_data.encode("utf-8"))
-
-    def _send_text_response(self, text, status=200):
-        """Send plain text response"""
-        self.send_response(status)
-        self.send_header("Content-Type", "text/plain")
-        self.send_header("Content-Length", str(len(text)))
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.end_headers()
-
-        self.wfile.write(text.encode("utf-8"))
-
-    def _send_error(self, status, message):
-        """Send error response"""
-        error_data = {"error": message, "status": status}
-        self._send_json_response(error_data, status)
-
-    def _serve_help_page(self):
-        """Serve help/documentation page"""
-        help_html = """
+_HELP_HTML = """
         <!DOCTYPE html>
         <html>
         <head>
@@ -195,61 +96,401 @@ curl -X POST "http://localhost:8080/start_stream" \\
         </html>
         """
 
+# The help page and the static error bodies never change, so encode them once
+_HELP_HTML_BYTES = _HELP_HTML.encode("utf-8")
+_HELP_HTML_LEN = str(len(_HELP_HTML_BYTES))
+
+_STATIC_ERROR_BODIES = {
+    (status, message): json.dumps(
+        {"error": message, "status": status}, separators=(",", ":")
+    ).encode("utf-8")
+    for status, message in [
+        (404, "Endpoint not found"),
+        (400, "Missing 'args' in request body"),
+        (400, "Invalid JSON in request body"),
+    ]
+}
+
+
+def _start_stream_command(args):
+    """Build the START_STREAM datagram for a list of hackrf_sweep arguments"""
+    payload = json.dumps({"args": args}, separators=(",", ":"))
+    return b"START_STREAM " + payload.encode("utf-8")
+
+
+_FM_START_COMMAND = _start_stream_command(
+    ["-f", "88:108", "-g", "20", "-l", "16", "-w", "1000000"]
+)
+# Receive buffer for scan sockets, sized to absorb bursts of stream data.
+# The kernel caps it at net.core.rmem_max.
+DEFAULT_SCAN_RCVBUF = 8 * 1024 * 1024
+
+# Fixed parts of the streamed scan result. Only the counts are formatted
+# per scan; the keys are written as literal bytes.
+_SCAN_DATA_OPEN = b',"data":['
+_SCAN_FOOTER = b'],"lines_collected":%d,"total_lines":%d,"data_rate_per_second":%b}'
+
+# hackrf_sweep CSV lines are printable ASCII without quotes or backslashes,
+# which can be copied into a JSON string verbatim
+_JSON_PLAIN_LINE = re.compile(rb"[\x20\x21\x23-\x5b\x5d-\x7e]*")
+
+# Shared query mapping for requests without a query string. Handlers only
+# read their query parameters, so one instance is safe to reuse.
+_EMPTY_QUERY = {}
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_parse_qs(query):
+    """Parse a query string, reusing the result for repeated polling queries
+
+    The same dict is returned for every hit, so handlers must treat it as
+    read-only; copy it before mutating.
+    """
+    return parse_qs(query)
+
+
+def _drain_socket(sock):
+    """Discard any datagrams already queued on a socket (stale replies, stream tail)"""
+    # A socket in timeout mode polls before every recv, so switch to
+    # non-blocking for the drain and restore the timeout afterwards
+    timeout = sock.gettimeout()
+    sock.setblocking(False)
+    try:
+        while True:
+            sock.recv(65536)
+    except (BlockingIOError, InterruptedError):
+        pass
+    finally:
+        sock.settimeout(timeout)
+
+
+class UDPSocketPool:
+    """Pool of long-lived UDP sockets, connected to one server, reused across scan sessions"""
+
+    def __init__(self, server_addr, rcvbuf=DEFAULT_SCAN_RCVBUF, maxsize=8):
+        self.server_addr = server_addr
+        self.rcvbuf = rcvbuf
+        self._sockets = queue.Queue(maxsize=maxsize)
+
+    def acquire(self, timeout):
+        """Get an idle socket from the pool, or open a new one"""
+        try:
+            sock = self._sockets.get_nowait()
+            _drain_socket(sock)
+        except queue.Empty:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            # A large receive buffer absorbs stream bursts while the scan
+            # loop is busy writing to the HTTP client
+            if self.rcvbuf:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.rcvbuf)
+                granted = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+                # Linux reports double the requested size to account for overhead
+                if granted < self.rcvbuf:
+                    logger.warning(
+                        f"Scan socket receive buffer capped at {granted} bytes "
+                        f"(requested {self.rcvbuf}), raise net.core.rmem_max"
+                    )
+            # A connected UDP socket lets us use send/recv and has the kernel
+            # drop datagrams from any other peer
+            sock.connect(self.server_addr)
+        sock.settimeout(timeout)
+        return sock
+
+    def release(self, sock):
+        """Return a socket to the pool, closing it if the pool is full"""
+        try:
+            self._sockets.put_nowait(sock)
+        except queue.Full:
+            sock.close()
+
+
+def _is_command_reply(data):
+    """Tell command replies apart from stream data arriving on the same socket"""
+    return data[:1] == b"{" or data == b"PONG" or data == b"DISCONNECTED"
+
+
+class HackRFSession:
+    """Persistent UDP session with the HackRF server, shared by all handler threads
+
+    A background thread owns one connected socket and runs queued commands one
+    at a time, so every control request reaches the server from the same client
+    address. While idle it pings the server to keep the registration alive, and
+    after a socket error it reconnects with a fresh socket.
+    """
+
+    KEEPALIVE_INTERVAL = 30  # seconds
+
+    def __init__(self, server_addr):
+        self.server_addr = server_addr
+        self._commands = queue.Queue()
+        self._sock = None
+        self._registered = False
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, command, timeout=5):
+        """Queue a command and return a Future resolved with the reply bytes"""
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="hackrf-session", daemon=True
+                    )
+                    self._thread.start()
+
+        future = concurrent.futures.Future()
+        self._commands.put((command, timeout, future))
+        return future
+
+    def _run(self):
+        """Session thread: run queued commands, pinging the server when idle"""
+        while True:
+            try:
+                command, timeout, future = self._commands.get(
+                    timeout=self.KEEPALIVE_INTERVAL
+                )
+            except queue.Empty:
+                if self._registered:
+                    try:
+                        self._exchange(b"PING", 5)
+                    except Exception as e:
+                        logger.warning(f"Session keepalive failed: {e}")
+                        self._reset()
+                continue
+
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                reply = self._exchange(command, timeout)
+            except Exception as e:
+                self._reset()
+                future.set_exception(e)
+                continue
+
+            if command == b"CONNECT":
+                self._registered = True
+            elif command == b"DISCONNECT":
+                self._registered = False
+            future.set_result(reply)
+
+    def _reset(self):
+        """Drop the current socket; the next exchange opens a new one"""
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def _open(self):
+        """Open the session socket, re-registering with the server if needed"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.connect(self.server_addr)
+        self._sock = sock
+        if self._registered:
+            # The server knows clients by address, so a new socket has to
+            # connect again before its commands are accepted
+            logger.info("Reconnecting HackRF session")
+            self._sock.settimeout(5)
+            self._sock.send(b"CONNECT")
+            self._await_reply(5)
+
+    def _exchange(self, command, timeout):
+        """Send one command and wait for its reply"""
+        if self._sock is None:
+            self._open()
+
+        # Drop late replies and stream data left over from earlier commands
+        _drain_socket(self._sock)
+
+        self._sock.send(command)
+        return self._await_reply(timeout)
+
+    def _await_reply(self, timeout):
+        """Receive until a command reply arrives, skipping stream data"""
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise socket.timeout("timed out")
+            self._sock.settimeout(remaining)
+            data = self._sock.recv(4096)
+            if _is_command_reply(data):
+                return data
+
+
+class HackRFHTTPHandler(BaseHTTPRequestHandler):
+    """HTTP handler that proxies requests to HackRF UDP server"""
+
+    # HTTP/1.1 is required for chunked scan responses
+    protocol_version = "HTTP/1.1"
+
+    # Control commands share one session, scans use pooled dedicated sockets
+    session = HackRFSession(("localhost", 5000))
+    scan_socket_pool = UDPSocketPool(("localhost", 5000))
+
+    def log_message(self, format, *args):
+        """Override to use our logger"""
+        logger.info(f"{self.address_string()} - {format % args}")
+
+    def do_GET(self):
+        """Handle GET requests"""
+        # Request targets are plain paths, so skip urlparse and only parse a
+        # query string when there is one
+        raw_path = self.path
+        query_start = raw_path.find("?")
+        if query_start < 0:
+            path = raw_path
+            query_params = _EMPTY_QUERY
+        else:
+            path = raw_path[:query_start]
+            query_params = _cached_parse_qs(raw_path[query_start + 1 :])
+
+        try:
+            handler = _GET_ROUTES.get(path)
+            if handler is None:
+                self._send_error(404, "Endpoint not found")
+            else:
+                handler(self, query_params)
+
+        except Exception as e:
+            logger.error(f"Error handling GET {path}: {e}")
+            self._send_error(500, f"Server error: {str(e)}")
+
+    def do_POST(self):
+        """Handle POST requests"""
+        path = self.path.partition("?")[0]
+
+        try:
+            content_length = int(self.headers.get("Content-Length", 0))
+            post_data = self.rfile.read(content_length)
+
+            handler = _POST_ROUTES.get(path)
+            if handler is None:
+                self._send_error(404, "Endpoint not found")
+            else:
+                handler(self, post_data)
+
+        except Exception as e:
+            logger.error(f"Error handling POST {path}: {e}")
+            self._send_error(500, f"Server error: {str(e)}")
+
+    def _send_udp_command(self, command, timeout=5):
+        """Send command bytes to UDP server and get response"""
+        future = self.session.submit(command, timeout)
+        try:
+            # The session thread enforces the timeout, allow a little slack
+            response = future.result(timeout + 1)
+            return response.decode("utf-8", errors="ignore")
+
+        except concurrent.futures.TimeoutError:
+            # Still queued behind other commands: make sure it never runs,
+            # since the caller is told it failed
+            future.cancel()
+            raise Exception(f"UDP communication failed: timed out after {timeout} seconds")
+
+        except Exception as e:
+            raise Exception(f"UDP communication failed: {str(e)}")
+
+    def _send_body(self, body, content_type, status=200):
+        """Send an already encoded response body"""
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+
+        self.wfile.write(body)
+
+    def _send_json_response(self, data, status=200):
+        """Send JSON response"""
+        # Compact separators: no indentation whitespace on the wire, pipe
+        # through jq or similar for pretty output
+        response_data = json.dumps(data, separators=(",", ":"))
+        self._send_body(response_data.encode("utf-8"), "application/json", status)
+
+    def _send_text_response(self, text, status=200):
+        """Send plain text response"""
+        self._send_body(text.encode("utf-8"), "text/plain", status)
+
+    def _send_error(self, status, message):
+        """Send error response"""
+        body = _STATIC_ERROR_BODIES.get((status, message))
+        if body is not None:
+            self._send_body(body, "application/json", status)
+            return
+        error_data = {"error": message, "status": status}
+        self._send_json_response(error_data, status)
+
+    def _serve_help_page(self, query_params):
+        """Serve help/documentation page"""
         self.send_response(200)
         self.send_header("Content-Type", "text/html")
-        self.send_header("Content-Length", str(len(help_html)))
+        self.send_header("Content-Length", _HELP_HTML_LEN)
         self.end_headers()
-        self.wfile.write(help_html.encode("utf-8"))
+        self.wfile.write(_HELP_HTML_BYTES)
 
-    def _handle_connect(self):
+    def _relay_udp_response(self, response):
+        """Forward a UDP server reply as JSON if it is a JSON object, else as text"""
+        # Only JSON objects start with '{', so plain-text replies skip the
+        # (exception-raising) parse attempt entirely
+        if response.lstrip().startswith("{"):
+            try:
+                data = json.loads(response)
+            except json.JSONDecodeError:
+                pass
+            else:
+                self._send_json_response(data)
+                return
+        self._send_text_response(response)
+
+    def _handle_connect(self, query_params):
         """Handle connect request"""
-        response = self._send_udp_command("CONNECT")
-        try:
-            data = json.loads(response)
-            self._send_json_response(data)
-        except json.JSONDecodeError:
-            self._send_text_response(response)
+        response = self._send_udp_command(b"CONNECT")
+        self._relay_udp_response(response)
 
-    def _handle_stats(self):
+    def _handle_stats(self, query_params):
         """Handle stats request"""
-        response = self._send_udp_command("STATS")
-        try:
-            data = json.loads(response)
-            self._send_json_response(data)
-        except json.JSONDecodeError:
-            self._send_text_response(response)
+        response = self._send_udp_command(b"STATS")
+        self._relay_udp_response(response)
 
-    def _handle_ping(self):
+    def _handle_ping(self, query_params):
         """Handle ping request"""
-        response = self._send_udp_command("PING")
+        response = self._send_udp_command(b"PING")
         if response.strip() == "PONG":
             self._send_json_response({"status": "success", "response": "PONG"})
         else:
             self._send_text_response(response)
 
-    def _handle_disconnect(self):
+    def _handle_disconnect(self, query_params):
         """Handle disconnect request"""
-        response = self._send_udp_command("DISCONNECT")
+        response = self._send_udp_command(b"DISCONNECT")
         if response.strip() == "DISCONNECTED":
             self._send_json_response({"status": "success", "message": "Disconnected"})
         else:
             self._send_text_response(response)
 
-    def _handle_fm_scan(self, query_params):
-        """Handle FM radio scan request"""
-        duration = int(query_params.get("duration", [10])[0])
+    def _write_chunk(self, payload):
+        """Write one chunk of a chunked transfer-encoded response body"""
+        if payload:
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(payload), payload))
+
+    def _run_scan(self, start_command, duration, result):
+        """Run one CONNECT/START_STREAM/collect/DISCONNECT session
 
+        The scan result is streamed to the HTTP client with chunked transfer
+        encoding: the fields in ``result`` are sent first, then each data line
+        as it arrives, then the line counts once the scan is over.
+        """
         # Use a dedicated UDP socket for this client session
         client_sock = None
+        headers_sent = False
         try:
-            client_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            client_sock.settimeout(10.0)
-            server_addr = (self.udp_host, self.udp_port)
+            client_sock = self.scan_socket_pool.acquire(10.0)
 
             # Step 1: Connect to server
             logger.info("Connecting to HackRF UDP server...")
-            client_sock.sendto(b"CONNECT", server_addr)
-            response, addr = client_sock.recvfrom(4096)
+            client_sock.send(b"CONNECT")
+            response = client_sock.recv(4096)
 
             connect_response = response.decode("utf-8", errors="ignore")
             logger.info(f"Connect response: {connect_response[:100]}...")
@@ -268,11 +509,10 @@ curl -X POST "http://localhost:8080/start_stream" \\
             except json.JSONDecodeError:
                 logger.warning("Non-JSON connect response, continuing...")
 
-            # Step 2: Start FM scan
-            logger.info("Starting FM radio scan...")
-            fm_command = 'START_STREAM {"args": ["-f", "88:108", "-g", "20", "-l", "16", "-w", "1000000"]}'
-            client_sock.sendto(fm_command.encode("utf-8"), server_addr)
-            response, addr = client_sock.recvfrom(4096)
+            # Step 2: Start the scan
+            logger.info(f"Starting scan: {start_command.decode('utf-8')}")
+            client_sock.send(start_command)
+            response = client_sock.recv(4096)
 
             start_response = response.decode("utf-8", errors="ignore")
             logger.info(f"Start stream response: {start_response}")
@@ -288,82 +528,129 @@ curl -X POST "http://localhost:8080/start_stream" \\
                 self._send_error(500, f"Invalid response from server: {start_response}")
                 return
 
-            # Step 3: Collect streaming data
+            # Step 3: Stream data to the HTTP client as it arrives
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+            headers_sent = True
+
+            # Open the JSON object with the fixed fields, leaving it unclosed
+            header = json.dumps(result, separators=(",", ":"))
+            self._write_chunk(header[:-1].encode("utf-8") + _SCAN_DATA_OPEN)
+
             logger.info(f"Collecting data for {duration} seconds...")
-            collected_data = []
-            client_sock.settimeout(2.0)  # Shorter timeout for data collection
-
-            start_time = time.time()
-            consecutive_timeouts = 0
-
-            while time.time() - start_time < duration:
-                try:
-                    data, addr = client_sock.recvfrom(8192)
-                    line = data.decode("utf-8", errors="ignore").strip()
-
-                    # Filter out JSON responses and keep only data lines
-                    if line and not line.startswith("{") and "," in line:
-                        collected_data.append(line)
-                        consecutive_timeouts = 0
-
-                except socket.timeout:
-                    consecutive_timeouts += 1
-                    # If no data for 10 seconds, something might be wrong
-                    if consecutive_timeouts > 5:
-                        logger.warning(
-                            f"No data received for {consecutive_timeouts * 2} seconds"
-                        )
-                        if consecutive_timeouts > 15:  # 30 seconds without data
-                            break
-                    continue
+            lines_collected = 0
 
-            logger.info(f"Collected {len(collected_data)} lines of data")
+            # Wait for readability with one selector call, then drain every
+            # queued datagram without blocking before waiting again
+            selector = selectors.DefaultSelector()
+            selector.register(client_sock, selectors.EVENT_READ)
+            client_sock.setblocking(False)
+
+            deadline = time.monotonic() + duration
 
-            # Step 4: Stop stream
-            logger.info("Stopping stream...")
-            client_sock.settimeout(10.0)
-            client_sock.sendto(b"STOP_STREAM", server_addr)
             try:
-                response, addr = client_sock.recvfrom(4096)
-                logger.info(
-                    f"Stop response: {response.decode('utf-8', errors='ignore')}"
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+
+                    # Wait no longer than the time left so the scan ends on
+                    # the deadline rather than up to a poll interval late
+                    if not selector.select(remaining):
+                        continue
+
+                    chunk = bytearray()
+                    # Bounded so a busy stream cannot hold us past the deadline
+                    for _ in range(64):
+                        try:
+                            data = client_sock.recv(8192)
+                        except (BlockingIOError, InterruptedError):
+                            break
+                        # Filter out JSON responses and keep only data lines;
+                        # the server packs several lines into one datagram
+                        if data[:1] == b"{":
+                            continue
+                        for line in data.split(b"\n"):
+                            line = line.strip()
+                            if not line or b"," not in line:
+                                continue
+                            if lines_collected:
+                                chunk += b","
+                            if _JSON_PLAIN_LINE.fullmatch(line):
+                                # Printable ASCII with nothing to escape is
+                                # already a valid JSON string body
+                                chunk += b'"'
+                                chunk += line
+                                chunk += b'"'
+                            else:
+                                chunk += json.dumps(
+                                    line.decode("utf-8", errors="ignore")
+                                ).encode("utf-8")
+                            lines_collected += 1
+
+                    if chunk:
+                        self._write_chunk(chunk)
+
+                logger.info(f"Collected {lines_collected} lines of data")
+
+                # Close the data array with the counts, then end the body
+                rate = lines_collected / duration if duration > 0 else 0
+                self._write_chunk(
+                    _SCAN_FOOTER
+                    % (lines_collected, lines_collected, repr(rate).encode("ascii"))
                 )
-            except socket.timeout:
-                logger.warning("No response to STOP_STREAM command")
-
-            # Step 5: Disconnect
+                self.wfile.write(b"0\r\n\r\n")
+            except (BrokenPipeError, ConnectionResetError):
+                logger.warning("HTTP client went away during scan")
+                self.close_connection = True
+            finally:
+                selector.close()
+
+            # Step 4: Disconnect. The server stops any active stream as part
+            # of DISCONNECT, so a separate STOP_STREAM round-trip is not needed.
             logger.info("Disconnecting...")
-            client_sock.sendto(b"DISCONNECT", server_addr)
+            client_sock.settimeout(10.0)
+            client_sock.send(b"DISCONNECT")
             try:
-                response, addr = client_sock.recvfrom(4096)
-                logger.info(
-                    f"Disconnect response: {response.decode('utf-8', errors='ignore')}"
-                )
+                # Stream data may still be in flight ahead of the confirmation
+                deadline = time.time() + 10.0
+                while time.time() < deadline:
+                    response = client_sock.recv(8192)
+                    if response == b"DISCONNECTED":
+                        logger.info("Disconnect response: DISCONNECTED")
+                        break
             except socket.timeout:
                 logger.warning("No response to DISCONNECT command")
 
         except Exception as e:
-            logger.error(f"Error during FM scan: {e}")
-            self._send_error(500, f"Scan failed: {str(e)}")
-            return
-        finally:
+            logger.error(f"Error during scan: {e}")
+            if headers_sent:
+                # Too late for an error status, leave the chunked body
+                # unterminated so the client sees a truncated response
+                self.close_connection = True
+            else:
+                self._send_error(500, f"Scan failed: {str(e)}")
+            # The server may still be streaming to this socket, don't reuse it
             if client_sock:
                 client_sock.close()
+                client_sock = None
+        finally:
+            if client_sock:
+                self.scan_socket_pool.release(client_sock)
+
+    def _handle_fm_scan(self, query_params):
+        """Handle FM radio scan request"""
+        duration = int(query_params.get("duration", [10])[0])
 
-        # Return results
         result = {
             "scan_type": "FM Radio Band",
             "frequency_range": "88-108 MHz",
             "duration_seconds": duration,
-            "lines_collected": len(collected_data),
-            "data": collected_data if collected_data else [],
-            "total_lines": len(collected_data),
-            "data_rate_per_second": len(collected_data) / duration
-            if duration > 0
-            else 0,
         }
-
-        self._send_json_response(result)
+        self._run_scan(_FM_START_COMMAND, duration, result)
 
     def _handle_custom_scan(self, query_params):
         """Handle custom frequency scan request"""
@@ -376,118 +663,7 @@ curl -X POST "http://localhost:8080/start_stream" \\
         # Build command args
         args = ["-f", freq_range, "-g", gain, "-l", lna_gain, "-w", bin_width]
 
-        # Use the same session management approach as FM scan
-        client_sock = None
-        try:
-            client_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            client_sock.settimeout(10.0)
-            server_addr = (self.udp_host, self.udp_port)
-
-            # Step 1: Connect to server
-            logger.info("Connecting to HackRF UDP server for custom scan...")
-            client_sock.sendto(b"CONNECT", server_addr)
-            response, addr = client_sock.recvfrom(4096)
-
-            connect_response = response.decode("utf-8", errors="ignore")
-            logger.info(f"Connect response: {connect_response[:100]}...")
-
-            # Verify connection was successful
-            try:
-                connect_data = json.loads(connect_response)
-                if connect_data.get("status") != "connected":
-                    self._send_json_response(
-                        {
-                            "error": "Failed to connect to server",
-                            "details": connect_data,
-                        }
-                    )
-                    return
-            except json.JSONDecodeError:
-                logger.warning("Non-JSON connect response, continuing...")
-
-            # Step 2: Start custom scan
-            logger.info(f"Starting custom scan: {args}")
-            command = f'START_STREAM {{"args": {json.dumps(args)}}}'
-            client_sock.sendto(command.encode("utf-8"), server_addr)
-            response, addr = client_sock.recvfrom(4096)
-
-            start_response = response.decode("utf-8", errors="ignore")
-            logger.info(f"Start stream response: {start_response}")
-
-            try:
-                start_data = json.loads(start_response)
-                if start_data.get("status") != "stream_started":
-                    self._send_json_response(
-                        {"error": "Failed to start stream", "details": start_data}
-                    )
-                    return
-            except json.JSONDecodeError:
-                self._send_error(500, f"Invalid response from server: {start_response}")
-                return
-
-            # Step 3: Collect streaming data
-            logger.info(f"Collecting data for {duration} seconds...")
-            collected_data = []
-            client_sock.settimeout(2.0)  # Shorter timeout for data collection
-
-            start_time = time.time()
-            consecutive_timeouts = 0
-
-            while time.time() - start_time < duration:
-                try:
-                    data, addr = client_sock.recvfrom(8192)
-                    line = data.decode("utf-8", errors="ignore").strip()
-
-                    # Filter out JSON responses and keep only data lines
-                    if line and not line.startswith("{") and "," in line:
-                        collected_data.append(line)
-                        consecutive_timeouts = 0
-
-                except socket.timeout:
-                    consecutive_timeouts += 1
-                    # If no data for 10 seconds, something might be wrong
-                    if consecutive_timeouts > 5:
-                        logger.warning(
-                            f"No data received for {consecutive_timeouts * 2} seconds"
-                        )
-                        if consecutive_timeouts > 15:  # 30 seconds without data
-                            break
-                    continue
-
-            logger.info(f"Collected {len(collected_data)} lines of data")
-
-            # Step 4: Stop stream
-            logger.info("Stopping custom scan stream...")
-            client_sock.settimeout(10.0)
-            client_sock.sendto(b"STOP_STREAM", server_addr)
-            try:
-                response, addr = client_sock.recvfrom(4096)
-                logger.info(
-                    f"Stop response: {response.decode('utf-8', errors='ignore')}"
-                )
-            except socket.timeout:
-                logger.warning("No response to STOP_STREAM command")
-
-            # Step 5: Disconnect
-            logger.info("Disconnecting...")
-            client_sock.sendto(b"DISCONNECT", server_addr)
-            try:
-                response, addr = client_sock.recvfrom(4096)
-                logger.info(
-                    f"Disconnect response: {response.decode('utf-8', errors='ignore')}"
-                )
-            except socket.timeout:
-                logger.warning("No response to DISCONNECT command")
-
-        except Exception as e:
-            logger.error(f"Error during custom scan: {e}")
-            self._send_error(500, f"Scan failed: {str(e)}")
-            return
-        finally:
-            if client_sock:
-                client_sock.close()
-
-        # Return results
+        command = _start_stream_command(args)
         result = {
             "scan_type": "Custom Frequency Scan",
             "frequency_range": freq_range + " MHz",
@@ -497,15 +673,8 @@ curl -X POST "http://localhost:8080/start_stream" \\
                 "bin_width": bin_width,
             },
             "duration_seconds": duration,
-            "lines_collected": len(collected_data),
-            "data": collected_data if collected_data else [],
-            "total_lines": len(collected_data),
-            "data_rate_per_second": len(collected_data) / duration
-            if duration > 0
-            else 0,
         }
-
-        self._send_json_response(result)
+        self._run_scan(command, duration, result)
 
     def _handle_start_stream(self, post_data):
         """Handle start stream POST request"""
@@ -518,41 +687,101 @@ curl -X POST "http://localhost:8080/start_stream" \\
                 return
 
             # Connect and start stream
-            self._send_udp_command("CONNECT")
-            command = f'START_STREAM {{"args": {json.dumps(args)}}}'
-            response = self._send_udp_command(command)
+            self._send_udp_command(b"CONNECT")
+            response = self._send_udp_command(_start_stream_command(args))
 
-            try:
-                response_data = json.loads(response)
-                self._send_json_response(response_data)
-            except json.JSONDecodeError:
-                self._send_text_response(response)
+            self._relay_udp_response(response)
 
         except json.JSONDecodeError:
             self._send_error(400, "Invalid JSON in request body")
 
-    def _handle_stop_stream(self):
+    def _handle_stop_stream(self, post_data):
         """Handle stop stream request"""
-        response = self._send_udp_command("STOP_STREAM")
-        try:
-            data = json.loads(response)
-            self._send_json_response(data)
-        except json.JSONDecodeError:
-            self._send_text_response(response)
+        response = self._send_udp_command(b"STOP_STREAM")
+        self._relay_udp_response(response)
+
+
+# Path -> handler dispatch tables. GET handlers take the parsed query
+# parameters, POST handlers the raw request body.
+_GET_ROUTES = {
+    "/": HackRFHTTPHandler._serve_help_page,
+    "/connect": HackRFHTTPHandler._handle_connect,
+    "/stats": HackRFHTTPHandler._handle_stats,
+    "/ping": HackRFHTTPHandler._handle_ping,
+    "/disconnect": HackRFHTTPHandler._handle_disconnect,
+    "/scan/fm": HackRFHTTPHandler._handle_fm_scan,
+    "/scan/custom": HackRFHTTPHandler._handle_custom_scan,
+}
+
+_POST_ROUTES = {
+    "/start_stream": HackRFHTTPHandler._handle_start_stream,
+    "/stop_stream": HackRFHTTPHandler._handle_stop_stream,
+}
+
+
+class ReusePortHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server whose listen socket can be shared by worker processes
 
+    With SO_REUSEPORT each worker binds its own socket to the same port and
+    the kernel balances incoming connections across them.
+    """
 
-def create_handler_class(udp_host, udp_port):
+    allow_reuse_address = True
+    allow_reuse_port = True
+
+
+def create_handler_class(udp_host, udp_port, rcvbuf=DEFAULT_SCAN_RCVBUF):
     """Create handler class with UDP server configuration"""
 
     class ConfiguredHandler(HackRFHTTPHandler):
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, udp_host=udp_host, udp_port=udp_port, **kwargs)
+        session = HackRFSession((udp_host, udp_port))
+        scan_socket_pool = UDPSocketPool((udp_host, udp_port), rcvbuf=rcvbuf)
 
     return ConfiguredHandler
 
 
+def serve(
+    http_host,
+    http_port,
+    udp_host,
+    udp_port,
+    rcvbuf=DEFAULT_SCAN_RCVBUF,
+    cpus=None,
+    reuse_port=False,
+):
+    """Run one HTTP wrapper worker until interrupted
+
+    reuse_port shares the HTTP port with sibling workers; a lone wrapper
+    leaves it off so a second instance on the same port fails to bind.
+    """
+    if cpus:
+        # Keep the handler threads on the CPUs that service the NIC queue
+        # carrying the UDP traffic to avoid cross-core wakeups
+        if hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, cpus)
+            logger.info(f"Pinned HTTP worker {os.getpid()} to CPUs {sorted(cpus)}")
+        else:
+            logger.warning("CPU pinning is not supported on this platform")
+
+    # Each worker gets its own handler class, and with it its own UDP sockets
+    handler_class = create_handler_class(udp_host, udp_port, rcvbuf)
+
+    # Serve each HTTP connection on its own thread so long scans do not
+    # block control requests like /ping and /stats
+    server_class = ReusePortHTTPServer if reuse_port else ThreadingHTTPServer
+    httpd = server_class((http_host, http_port), handler_class)
+
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        httpd.shutdown()
+    finally:
+        httpd.server_close()
+
+
 def main():
     import argparse
+    import multiprocessing
 
     parser = argparse.ArgumentParser(
         description="HackRF HTTP Wrapper for curl compatibility"
@@ -565,23 +794,75 @@ def main():
     parser.add_argument(
         "--udp-port", type=int, default=5000, help="HackRF UDP server port"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes sharing the HTTP port via SO_REUSEPORT "
+        "(default: 1). Each worker talks to the UDP server from its own "
+        "sockets, so /start_stream and /stop_stream may land on different workers",
+    )
+    parser.add_argument(
+        "--pin-cpu",
+        type=lambda value: [int(cpu) for cpu in value.split(",")],
+        metavar="CPU[,CPU...]",
+        help="Pin the wrapper to these CPUs, ideally the ones servicing the "
+        "NIC RX queue used for UDP traffic. With several workers, worker N "
+        "is pinned to the Nth CPU in the list",
+    )
+    parser.add_argument(
+        "--rcvbuf",
+        type=int,
+        default=DEFAULT_SCAN_RCVBUF,
+        help="SO_RCVBUF size in bytes for scan sockets, 0 keeps the system "
+        f"default (default: {DEFAULT_SCAN_RCVBUF})",
+    )
 
     args = parser.parse_args()
 
-    handler_class = create_handler_class(args.udp_host, args.udp_port)
-
-    httpd = HTTPServer((args.http_host, args.http_port), handler_class)
-
     print(f"🌐 HackRF HTTP Wrapper started on http://{args.http_host}:{args.http_port}")
     print(f"📡 Proxying to HackRF UDP server at {args.udp_host}:{args.udp_port}")
     print(f"📖 Open http://{args.http_host}:{args.http_port} for API documentation")
+    if args.workers > 1:
+        print(f"⚙️  Running {args.workers} worker processes")
     print("Press Ctrl+C to stop")
 
+    serve_args = (
+        args.http_host,
+        args.http_port,
+        args.udp_host,
+        args.udp_port,
+        args.rcvbuf,
+    )
+
+    if args.workers <= 1:
+        serve(*serve_args, cpus=set(args.pin_cpu or ()))
+        print("\n🛑 Shutting down HTTP wrapper...")
+        return
+
+    workers = []
+    for i in range(args.workers):
+        cpus = {args.pin_cpu[i % len(args.pin_cpu)]} if args.pin_cpu else None
+        workers.append(
+            multiprocessing.Process(
+                target=serve,
+                args=serve_args,
+                kwargs={"cpus": cpus, "reuse_port": True},
+                daemon=True,
+            )
+        )
+    for worker in workers:
+        worker.start()
+
     try:
-        httpd.serve_forever()
+        for worker in workers:
+            worker.join()
     except KeyboardInterrupt:
         print("\n🛑 Shutting down HTTP wrapper...")
-        httpd.shutdown()
+        for worker in workers:
+            worker.terminate()
+        for worker in workers:
+            worker.join()
 
 
 if __name__ == "__main__":
@@ -4,31 +4,215 @@ HackRF UDP Client Example
 A simple client to demonstrate how to connect and stream from the HackRF UDP server.
 """
 
+import asyncio
+import ctypes
+import ctypes.util
+import errno
+import select
 import socket
-import json
+import os
+import queue
+import selectors
 import sys
+import threading
+import traceback
 import argparse
 import time
 
+# orjson is an optional speed-up; the standard library handles the same data
+try:
+    import orjson
+
+    loads = orjson.loads
+    dumps = orjson.dumps
+except ImportError:
+    import json
+
+    loads = json.loads
+
+    def dumps(obj):
+        """Serialize obj to compact JSON bytes, matching orjson.dumps"""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+# Control messages understood by the server
+CONNECT = b"CONNECT"
+START_STREAM = b"START_STREAM "
+STOP_STREAM = b"STOP_STREAM"
+STATS = b"STATS"
+PING = b"PING"
+DISCONNECT = b"DISCONNECT"
+
+
+def _is_reply(data):
+    """Tell a control reply apart from hackrf_sweep stream data"""
+    return data[:1] == b"{" or data == b"PONG" or data == b"DISCONNECTED"
+
+
+# Socket buffer size requested for the stream. The kernel caps it at
+# net.core.rmem_max / net.core.wmem_max.
+DEFAULT_SOCKET_BUFFER = 16 * 1024 * 1024
+
+# Datagrams fetched per recvmmsg(2) call and the space reserved for each
+RECV_BATCH = 32
+RECV_SIZE = 65536
+
+# Received datagrams waiting to be printed before new ones are dropped
+STREAM_QUEUE_SIZE = 10000
+
+# Printed stream lines are collected and written to stdout in chunks this big
+OUTPUT_CHUNK = 65536
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+def _load_recvmmsg():
+    """Return libc's recvmmsg on Linux, or None elsewhere"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        recvmmsg = libc.recvmmsg
+    except (OSError, AttributeError):
+        return None
+    recvmmsg.argtypes = [
+        ctypes.c_int,
+        ctypes.POINTER(_MMsgHdr),
+        ctypes.c_uint,
+        ctypes.c_int,
+        ctypes.c_void_p,
+    ]
+    recvmmsg.restype = ctypes.c_int
+    return recvmmsg
+
+
+_recvmmsg = _load_recvmmsg()
+
+
+class BatchReceiver:
+    """Receive up to RECV_BATCH datagrams per system call with recvmmsg(2)
+
+    The message headers and buffers are allocated once and reused, so the
+    datagrams returned by recv_batch() are copies.
+    """
+
+    def __init__(self, sock, batch=RECV_BATCH, size=RECV_SIZE):
+        self.sock = sock
+        self.batch = batch
+        self.size = size
+        self._buffer = bytearray(batch * size)
+        self._view = memoryview(self._buffer)
+        base = ctypes.addressof(ctypes.c_char.from_buffer(self._buffer))
+        self._iovecs = (_IOVec * batch)()
+        self._msgs = (_MMsgHdr * batch)()
+        for i in range(batch):
+            self._iovecs[i].iov_base = base + i * size
+            self._iovecs[i].iov_len = size
+            self._msgs[i].msg_hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            self._msgs[i].msg_hdr.msg_iovlen = 1
+
+    def recv_batch(self, timeout):
+        """Wait up to timeout seconds for data and return the queued datagrams"""
+        fd = self.sock.fileno()
+        while True:
+            count = _recvmmsg(fd, self._msgs, self.batch, socket.MSG_DONTWAIT, None)
+            if count >= 0:
+                break
+            err = ctypes.get_errno()
+            if err == errno.EINTR:
+                continue
+            if err not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                raise OSError(err, os.strerror(err))
+            if not select.select([fd], [], [], timeout)[0]:
+                raise socket.timeout("timed out")
+        size = self.size
+        view = self._view
+        return [
+            bytes(view[i * size : i * size + self._msgs[i].msg_len])
+            for i in range(count)
+        ]
+
 
 class HackRFClient:
     """Simple UDP client for HackRF server"""
 
-    def __init__(self, host="localhost", port=5000):
+    def __init__(
+        self, host="localhost", port=5000, rcvbuf=DEFAULT_SOCKET_BUFFER, debug=False
+    ):
         self.host = host
         self.port = port
+        self.debug = debug
+        self._addr = (host, port)
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._send = self.socket.send
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self.socket, selectors.EVENT_READ)
+        self._set_buffer_size(socket.SO_RCVBUF, rcvbuf, "rmem_max")
+        self._set_buffer_size(socket.SO_SNDBUF, rcvbuf, "wmem_max")
         self.socket.settimeout(10.0)  # 10 second timeout
         self.connected = False
+        self._receiver = BatchReceiver(self.socket) if _recvmmsg else None
+        # Reused receive buffer for the recv_into fallback
+        self._rxbuf = bytearray(RECV_SIZE)
+        self._rxview = memoryview(self._rxbuf)
+        self._out = bytearray()
+
+    def _set_buffer_size(self, option, size, limit):
+        """Request a socket buffer size and warn if the kernel capped it"""
+        self.socket.setsockopt(socket.SOL_SOCKET, option, size)
+        # Linux reports double the usable size to account for bookkeeping
+        granted = self.socket.getsockopt(socket.SOL_SOCKET, option)
+        if granted < size:
+            print(
+                f"⚠️ Socket buffer capped at {granted} bytes "
+                f"(requested {size}), raise net.core.{limit}"
+            )
+
+    def _request(self, message, timeout=3.0, retries=3):
+        """Send a control message and return the server's reply
+
+        The message is re-sent if no reply arrives within timeout / retries
+        seconds. Stream data still arriving on the socket is skipped. Raises
+        socket.timeout once every attempt has gone unanswered.
+        """
+        wait = timeout / retries
+        for _ in range(retries):
+            self._send(message)
+            deadline = time.monotonic() + wait
+            while (remaining := deadline - time.monotonic()) > 0:
+                if not self._selector.select(remaining):
+                    break
+                response = self.socket.recv(RECV_SIZE)
+                if _is_reply(response):
+                    return response
+        raise socket.timeout(f"no reply to {message.split(b' ', 1)[0].decode()}")
 
     def connect(self):
         """Connect to the HackRF server"""
         try:
             print(f"Connecting to HackRF server at {self.host}:{self.port}...")
-            self.socket.sendto(b"CONNECT", (self.host, self.port))
-
-            response, addr = self.socket.recvfrom(4096)
-            response_data = json.loads(response.decode("utf-8"))
+            # A connected UDP socket skips the route lookup on every send and
+            # only accepts datagrams from the server
+            self.socket.connect(self._addr)
+            response = self._request(CONNECT)
+            response_data = loads(response)
 
             if response_data.get("status") == "connected":
                 self.connected = True
@@ -52,13 +236,12 @@ class HackRFClient:
 
         try:
             command = {"args": hackrf_args}
-            message = f"START_STREAM {json.dumps(command)}"
+            message = START_STREAM + dumps(command)
 
             print(f"Starting stream with args: {hackrf_args}")
-            self.socket.sendto(message.encode("utf-8"), (self.host, self.port))
-
-            response, addr = self.socket.recvfrom(4096)
-            response_data = json.loads(response.decode("utf-8"))
+            # Not retried: a repeated START_STREAM would restart the sweep
+            response = self._request(message, timeout=10.0, retries=1)
+            response_data = loads(response)
 
             if response_data.get("status") == "stream_started":
                 print("✓ Stream started successfully!")
@@ -82,10 +265,9 @@ class HackRFClient:
 
         try:
             print("Stopping stream...")
-            self.socket.sendto(b"STOP_STREAM", (self.host, self.port))
-
-            response, addr = self.socket.recvfrom(4096)
-            response_data = json.loads(response.decode("utf-8"))
+            # The server waits up to 5 s for hackrf_sweep to exit
+            response = self._request(STOP_STREAM, timeout=10.0, retries=2)
+            response_data = loads(response)
 
             if response_data.get("status") == "stream_stopped":
                 print("✓ Stream stopped successfully!")
@@ -105,28 +287,52 @@ class HackRFClient:
             return False
 
         try:
-            self.socket.sendto(b"STATS", (self.host, self.port))
-            response, addr = self.socket.recvfrom(4096)
-            stats = json.loads(response.decode("utf-8"))
+            # The reply is a single datagram of at most RECV_SIZE bytes, so a
+            # full parse is cheap; the report is then written in one call
+            response = self._request(STATS)
+            stats = loads(response)
 
-            print("\n📊 Server Statistics:")
-            print(f"  Total clients: {stats['total_clients']}")
-            print(f"  Server running: {stats['server_running']}")
+            report = [
+                "\n📊 Server Statistics:",
+                f"  Total clients: {stats['total_clients']}",
+                f"  Server running: {stats['server_running']}",
+            ]
 
             if stats["clients"]:
-                print("  Active clients:")
-                for client in stats["clients"]:
-                    duration_mins = client["duration"] / 60
-                    print(
-                        f"    - {client['address']} (connected {duration_mins:.1f}m ago)"
-                    )
+                report.append("  Active clients:")
+                report.extend(
+                    f"    - {client['address']} "
+                    f"(connected {client['duration'] / 60:.1f}m ago)"
+                    for client in stats["clients"]
+                )
 
+            print("\n".join(report))
             return True
 
         except Exception as e:
             print(f"✗ Stats error: {e}")
             return False
 
+    def _receive_batch(self):
+        """Receive up to RECV_BATCH queued datagrams from the listening socket
+
+        Called when the socket is readable while it is non-blocking; returns
+        an empty list (or raises socket.timeout) if nothing was queued.
+        """
+        if self._receiver is not None:
+            return self._receiver.recv_batch(0.0)
+
+        # Without recvmmsg, keep reading until the queue is empty so one
+        # wakeup still handles a burst of datagrams
+        batch = []
+        for _ in range(RECV_BATCH):
+            try:
+                n = self.socket.recv_into(self._rxbuf)
+            except BlockingIOError:
+                break
+            batch.append(bytes(self._rxview[:n]))
+        return batch
+
     def listen_to_stream(self, duration=None):
         """Listen to the HackRF data stream"""
         if not self.connected:
@@ -134,105 +340,145 @@ class HackRFClient:
             return
 
         print(
-            f"Listening to stream{'...' if duration is None else f' for {duration} seconds...'}"
+            f"Listening to stream{f' for {duration} seconds...' if duration else '...'}"
         )
         print("Press Ctrl+C to stop listening")
+        # Stream lines bypass print(), so push out anything it still holds
+        sys.stdout.flush()
 
-        # Set socket to longer timeout for stream data
-        self.socket.settimeout(5.0)
+        # The event loop waits for readability, so reads must never block
+        self.socket.settimeout(0.0)
 
-        start_time = time.time()
-        line_count = 0
-        last_data_time = time.time()
-        consecutive_timeouts = 0
+        start_ns = time.monotonic_ns()
+        self._line_count = 0
+        self._dropped = 0
 
         try:
-            while True:
-                current_time = time.time()
-
-                if duration and (current_time - start_time) > duration:
-                    print(f"\n✓ Finished listening for {duration} seconds")
-                    break
-
-                try:
-                    data, addr = self.socket.recvfrom(
-                        65536
-                    )  # Increased buffer size for radio spectrum stream
-
-                    # Reset timeout counter on successful receive
-                    consecutive_timeouts = 0
-                    # last_data_time = current_time
-
-                    # Handle different types of data
-                    try:
-                        # Try to decode as JSON first (server responses)
-                        decoded = data.decode("utf-8")
-                        # if decoded.startswith("{") or decoded.startswith("["):
-                        #     try:
-                        #         json_data = json.loads(decoded)
-                        #         if "error" in json_data:
-                        #             print(f"\n❌ Server error: {json_data['error']}")
-                        #             break
-                        #         elif "status" in json_data:
-                        #             print(f"\n📢 Server message: {json_data}")
-                        #             continue
-                        #     except json.JSONDecodeError:
-                        #         pass
-
-                        # Regular hackrf_sweep output
-                        line = decoded.strip()
-                        if line and not line.startswith("{"):
-                            line_count += 1
-                            # Show full line
-                            # Show first few lines in full, then sample
-                            print(f"[{line_count:06d}] {line}")
-                            # if line_count <= 10 or line_count % 100 == 0:
-                            #    print(f"[{line_count:06d}] {line}")
-                            # elif line_count % 1000 == 0:
-                            #    elapsed = current_time - start_time
-                            #    rate = line_count / elapsed if elapsed > 0 else 0
-                            #    print(f"[{line_count:06d}] {line} (Rate: {rate:.1f} lines/sec)")
-
-                    except UnicodeDecodeError:
-                        # Handle binary data
-                        line_count += 1
-                        if line_count <= 5 or line_count % 1000 == 0:
-                            print(f"[{line_count:06d}] Binary data: {len(data)} bytes")
-
-                except socket.timeout:
-                    consecutive_timeouts += 1
-
-                    # Check if we've been without data for too long
-                    if consecutive_timeouts > 20:  # 100 seconds without data
-                        print(
-                            f"\n⚠️ No data received for {consecutive_timeouts * 5} seconds"
-                        )
-                        print("Stream may have ended or connection lost")
-                        break
-
-                    # Periodic status update during timeouts
-                    if consecutive_timeouts % 4 == 0:  # Every 20 seconds
-                        elapsed = current_time - start_time
-                        print(
-                            f"\n📊 Status: {line_count} lines received in {elapsed:.1f}s (waiting for data...)"
-                        )
-
-                    continue
-
-                except KeyboardInterrupt:
-                    print("\n⏹️ Stopped listening by user")
-                    break
+            asyncio.run(self._listen(duration, start_ns))
 
+        except KeyboardInterrupt:
+            self._flush_output()
+            print("\n⏹️ Stopped listening by user")
         except Exception as e:
+            self._flush_output()
             print(f"\n✗ Stream listening error: {e}")
-            import traceback
-
-            print(f"Traceback: {traceback.format_exc()}")
+            if self.debug:
+                print(f"Traceback: {traceback.format_exc()}")
         finally:
+            self._flush_output()
             # Restore original timeout
             self.socket.settimeout(10.0)
-            elapsed = time.time() - start_time
-            print(f"\n📈 Summary: Received {line_count} lines in {elapsed:.1f} seconds")
+            elapsed = (time.monotonic_ns() - start_ns) / 1e9
+            print(
+                f"\n📈 Summary: Received {self._line_count} lines in {elapsed:.1f} seconds"
+            )
+            if self._dropped:
+                print(f"⚠️ Dropped {self._dropped} datagrams while output lagged")
+
+    async def _listen(self, duration, start_ns):
+        """Drain the socket on the event loop while a worker thread prints"""
+        loop = asyncio.get_running_loop()
+        lines = queue.SimpleQueue()
+        quiet = loop.create_future()
+
+        def on_readable():
+            try:
+                batch = self._receive_batch()
+            except (BlockingIOError, socket.timeout):
+                return
+            if lines.qsize() > STREAM_QUEUE_SIZE:
+                # Shed here rather than let the kernel buffer overflow
+                self._dropped += len(batch)
+                return
+            for data in batch:
+                lines.put_nowait(data)
+
+        def on_quiet():
+            if not quiet.done():
+                quiet.set_result(None)
+
+        printer = threading.Thread(
+            target=self._consume,
+            args=(lines, start_ns, lambda: loop.call_soon_threadsafe(on_quiet)),
+            daemon=True,
+        )
+
+        # add_reader keeps the socket ours; a datagram endpoint would take it
+        # over and close it along with the transport
+        fd = self.socket.fileno()
+        loop.add_reader(fd, on_readable)
+        printer.start()
+        timed_out = False
+        try:
+            # A duration of 0 (or None) means listen until stopped
+            await asyncio.wait_for(quiet, duration or None)
+        except TimeoutError:
+            timed_out = True
+        finally:
+            loop.remove_reader(fd)
+            # Let the printer finish what was already received
+            lines.put(None)
+            printer.join()
+
+        if timed_out:
+            print(f"\n✓ Finished listening for {duration} seconds")
+
+    def _consume(self, lines, start_ns, on_quiet):
+        """Print queued stream lines until told to stop or the stream goes quiet"""
+        consecutive_timeouts = 0
+
+        while True:
+            try:
+                data = lines.get(timeout=5.0)
+            except queue.Empty:
+                consecutive_timeouts += 1
+
+                # Check if we've been without data for too long
+                if consecutive_timeouts > 20:  # 100 seconds without data
+                    print(
+                        f"\n⚠️ No data received for {consecutive_timeouts * 5} seconds"
+                    )
+                    print("Stream may have ended or connection lost")
+                    on_quiet()
+                    consecutive_timeouts = 0
+
+                # Periodic status update during timeouts
+                elif consecutive_timeouts % 4 == 0:  # Every 20 seconds
+                    elapsed = (time.monotonic_ns() - start_ns) / 1e9
+                    print(
+                        f"\n📊 Status: {self._line_count} lines received in {elapsed:.1f}s (waiting for data...)"
+                    )
+
+                continue
+
+            if data is None:
+                self._flush_output()
+                return
+
+            # Reset timeout counter on successful receive
+            consecutive_timeouts = 0
+
+            # JSON server messages are recognised by their first byte and
+            # skipped; hackrf_sweep lines are copied out without decoding
+            if data[:1] != b"{":
+                # The server packs several lines into one datagram
+                for line in data.split(b"\n"):
+                    line = line.strip()
+                    if line:
+                        self._line_count += 1
+                        self._out += b"[%06d] %s\n" % (self._line_count, line)
+
+            # Write in large chunks while data is queued, and promptly once
+            # the queue runs dry so a slow stream still shows up live
+            if len(self._out) >= OUTPUT_CHUNK or lines.empty():
+                self._flush_output()
+
+    def _flush_output(self):
+        """Write buffered stream lines to stdout"""
+        if self._out:
+            sys.stdout.buffer.write(self._out)
+            sys.stdout.buffer.flush()
+            self._out.clear()
 
     def ping(self):
         """Send ping to server"""
@@ -241,8 +487,7 @@ class HackRFClient:
             return False
 
         try:
-            self.socket.sendto(b"PING", (self.host, self.port))
-            response, addr = self.socket.recvfrom(1024)
+            response = self._request(PING)
 
             if response == b"PONG":
                 print("✓ Ping successful")
@@ -260,60 +505,108 @@ class HackRFClient:
         if self.connected:
             try:
                 print("Disconnecting...")
-                self.socket.sendto(b"DISCONNECT", (self.host, self.port))
-
-                # Set a shorter timeout for disconnect response
-                original_timeout = self.socket.gettimeout()
-                self.socket.settimeout(2.0)
-
-                # Try to get disconnect response, but handle data that might still be streaming
-                disconnect_confirmed = False
-                attempts = 0
-                max_attempts = 5
-
-                while not disconnect_confirmed and attempts < max_attempts:
-                    try:
-                        response, addr = self.socket.recvfrom(1024)
-                        attempts += 1
-
-                        if response == b"DISCONNECTED":
-                            print("✓ Disconnected successfully")
-                            disconnect_confirmed = True
-                        else:
-                            # Still receiving data, which is normal during disconnect
-                            decoded = response.decode("utf-8", errors="ignore").strip()
-                            if decoded.startswith("{") or "DISCONNECT" in decoded:
-                                print("✓ Disconnected successfully")
-                                disconnect_confirmed = True
-                            else:
-                                # This is just remaining stream data, ignore it
-                                if attempts == 1:
-                                    print(
-                                        "⏳ Waiting for disconnect confirmation (still receiving data)..."
-                                    )
-                                continue
-
-                    except socket.timeout:
-                        # Timeout is fine, server might have already disconnected us
-                        print("✓ Disconnected (timeout - assumed successful)")
-                        break
-
-                if not disconnect_confirmed and attempts >= max_attempts:
-                    print(
-                        "⚠️ Disconnect response unclear, but proceeding with disconnection"
-                    )
-
-                # Restore original timeout
-                self.socket.settimeout(original_timeout)
+                self._request(DISCONNECT, timeout=2.0, retries=2)
+                print("✓ Disconnected successfully")
 
+            except socket.timeout:
+                # Timeout is fine, server might have already disconnected us
+                print("✓ Disconnected (timeout - assumed successful)")
             except Exception as e:
                 print(f"Disconnect error: {e}")
             finally:
                 self.connected = False
 
+        self._selector.close()
         self.socket.close()
 
 
+def tune_process(cpu=None, realtime=False):
+    """Pin the client to one CPU and optionally give it real-time priority"""
+    if cpu is not None:
+        # Staying on one core keeps the receive loop's caches warm; pick the
+        # CPU that handles the NIC queue's IRQ for the lowest latency
+        try:
+            os.sched_setaffinity(0, {cpu})
+            print(f"Pinned client to CPU {cpu}")
+        except (AttributeError, OSError) as e:
+            print(f"⚠️ Could not pin client to CPU {cpu}: {e}")
+
+    if realtime:
+        # SCHED_FIFO needs CAP_SYS_NICE (or root)
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(20))
+            print("Running with SCHED_FIFO priority 20")
+        except (AttributeError, OSError) as e:
+            print(f"⚠️ Could not enable real-time scheduling: {e}")
+
+
+def _prompt_start(client):
+    """Ask for hackrf_sweep arguments and start a stream"""
+    args_input = input("HackRF args (e.g., -f 88:108 -g 20 -l 16): ").strip()
+    if args_input:
+        client.start_stream(args_input.split())
+    else:
+        print("No arguments provided")
+
+
+def _prompt_listen(client):
+    """Ask for a duration and listen to the stream"""
+    duration_input = input(
+        "Duration in seconds (or press Enter for indefinite): "
+    ).strip()
+    client.listen_to_stream(int(duration_input) if duration_input else None)
+
+
+def _print_help():
+    """List the interactive commands"""
+    print("Available commands:")
+    print("  stats  - Get server statistics")
+    print("  ping   - Ping the server")
+    print("  start  - Start a stream")
+    print("  stop   - Stop current stream")
+    print("  listen - Listen to stream data")
+    print("  quit   - Exit the client")
+
+
+def run_interactive(client):
+    """Read commands from the terminal until quit, exit or end of input"""
+    try:
+        # Line editing and history for input(); not available on every platform
+        import readline
+    except ImportError:
+        pass
+
+    handlers = {
+        "stats": client.get_stats,
+        "ping": client.ping,
+        "start": lambda: _prompt_start(client),
+        "stop": client.stop_stream,
+        "listen": lambda: _prompt_listen(client),
+        "help": _print_help,
+    }
+
+    print("\n🎛️  Interactive HackRF Client")
+    print("Commands: stats, ping, start, stop, listen, quit")
+
+    while True:
+        try:
+            cmd = input("\nhackrf> ").strip().lower()
+
+            if cmd == "quit" or cmd == "exit":
+                break
+
+            handler = handlers.get(cmd)
+            if handler is None:
+                print(f"Unknown command: {cmd}. Type 'help' for available commands.")
+            else:
+                handler()
+
+        except KeyboardInterrupt:
+            print("\nUse 'quit' to exit")
+        except EOFError:
+            break
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="HackRF UDP Client - Connect to HackRF UDP server",
@@ -346,10 +639,32 @@ Examples:
         "--listen", type=int, metavar="SECONDS", help="Listen to stream for N seconds"
     )
     parser.add_argument("--interactive", action="store_true", help="Interactive mode")
+    parser.add_argument(
+        "--rcvbuf",
+        type=int,
+        default=DEFAULT_SOCKET_BUFFER,
+        metavar="BYTES",
+        help=f"Socket buffer size (default: {DEFAULT_SOCKET_BUFFER})",
+    )
+    parser.add_argument(
+        "--cpu",
+        type=int,
+        metavar="N",
+        help="Pin the whole client process to CPU N from startup",
+    )
+    parser.add_argument(
+        "--rt",
+        action="store_true",
+        help="Use SCHED_FIFO real-time scheduling (requires CAP_SYS_NICE)",
+    )
+    parser.add_argument(
+        "--debug", action="store_true", help="Print tracebacks for stream errors"
+    )
 
     args, hackrf_args = parser.parse_known_args()
+    tune_process(args.cpu, args.rt)
 
-    client = HackRFClient(args.host, args.port)
+    client = HackRFClient(args.host, args.port, args.rcvbuf, args.debug)
 
     try:
         # Connect to server
@@ -375,53 +690,7 @@ Examples:
                     print("Stream started. Use --listen to receive data.")
 
         elif args.interactive:
-            print("\n🎛️  Interactive HackRF Client")
-            print("Commands: stats, ping, start, stop, listen, quit")
-
-            while True:
-                try:
-                    cmd = input("\nhackrf> ").strip().lower()
-
-                    if cmd == "quit" or cmd == "exit":
-                        break
-                    elif cmd == "stats":
-                        client.get_stats()
-                    elif cmd == "ping":
-                        client.ping()
-                    elif cmd == "start":
-                        args_input = input(
-                            "HackRF args (e.g., -f 88:108 -g 20 -l 16): "
-                        ).strip()
-                        if args_input:
-                            hackrf_args = args_input.split()
-                            client.start_stream(hackrf_args)
-                        else:
-                            print("No arguments provided")
-                    elif cmd == "stop":
-                        client.stop_stream()
-                    elif cmd == "listen":
-                        duration_input = input(
-                            "Duration in seconds (or press Enter for indefinite): "
-                        ).strip()
-                        duration = int(duration_input) if duration_input else None
-                        client.listen_to_stream(duration)
-                    elif cmd == "help":
-                        print("Available commands:")
-                        print("  stats  - Get server statistics")
-                        print("  ping   - Ping the server")
-                        print("  start  - Start a stream")
-                        print("  stop   - Stop current stream")
-                        print("  listen - Listen to stream data")
-                        print("  quit   - Exit the client")
-                    else:
-                        print(
-                            f"Unknown command: {cmd}. Type 'help' for available commands."
-                        )
-
-                except KeyboardInterrupt:
-                    print("\nUse 'quit' to exit")
-                except EOFError:
-                    break
+            run_interactive(client)
 
         else:
             # Just connect and show server info
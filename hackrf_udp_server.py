@@ -7,12 +7,22 @@ Clients can send their own hackrf_sweep options which are validated and executed
 
 import asyncio
 import argparse
+import ctypes
+import ctypes.util
+import heapq
 import logging
+import multiprocessing
+import os
 import signal
+import socket
+import struct
+import subprocess
 import sys
 import re
-from typing import Set, Dict, Any, Optional, List, Tuple
-from dataclasses import dataclass
+from typing import Set, Dict, Any, Optional, List, Tuple, Collection, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial, lru_cache
 from pathlib import Path
 import json
 import time
@@ -25,32 +35,273 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Stream output is packed into datagrams of at most this many bytes, which
+# fits a typical 1500-byte path MTU after IP/UDP headers
+MAX_DATAGRAM_SIZE = 1400
+# Bytes requested from the hackrf_sweep pipe per read
+PIPE_READ_SIZE = 65536
+# Output carried over between reads without forming a whole line or record
+# is dropped past this size, so malformed output cannot grow without bound
+MAX_PENDING_SIZE = 1 << 20
+# One -I sample: interleaved float32 I and Q
+IFFT_SAMPLE_SIZE = 8
+# Kernel buffer requested for the hackrf_sweep stdout pipe, so bursts do not
+# stall the process; capped by /proc/sys/fs/pipe-max-size
+PIPE_BUFFER_SIZE = 1 << 20
+# Control commands waiting for a worker; further commands are dropped
+COMMAND_QUEUE_SIZE = 1024
+# Coroutines handling START_STREAM, STOP_STREAM and DISCONNECT
+COMMAND_WORKERS = 4
 
-@dataclass
+
+def pack_lines(buf: bytes, limit: int = MAX_DATAGRAM_SIZE) -> Tuple[List[Tuple[int, int]], int, int]:
+    """Split complete text lines in buf into datagram-sized runs
+    
+    Returns the (start, end) offsets of each datagram, the number of bytes
+    consumed and the number of lines they hold. A trailing partial line is
+    left for the next read; a single line longer than limit gets a datagram
+    of its own.
+    """
+    end = buf.rfind(b'\n') + 1
+    cuts = []
+    start = 0
+    while start < end:
+        cut = end
+        if end - start > limit:
+            cut = buf.rfind(b'\n', start, start + limit) + 1
+            if cut <= start:
+                cut = buf.find(b'\n', start + limit) + 1
+        cuts.append((start, cut))
+        start = cut
+    return cuts, end, buf.count(b'\n', 0, end)
+
+
+def pack_frames(buf: bytes, limit: int = MAX_DATAGRAM_SIZE) -> Tuple[List[Tuple[int, int]], int, int]:
+    """Split complete binary (-B) records in buf into datagram-sized runs
+    
+    Each hackrf_sweep binary record is a little-endian uint32 length followed
+    by that many bytes. Records are never split across datagrams.
+    """
+    cuts = []
+    records = 0
+    start = pos = 0
+    size = len(buf)
+    while pos + 4 <= size:
+        record_end = pos + 4 + int.from_bytes(buf[pos:pos + 4], 'little')
+        if record_end > size:
+            break
+        if record_end - start > limit and pos > start:
+            cuts.append((start, pos))
+            start = pos
+        pos = record_end
+        records += 1
+    if pos > start:
+        cuts.append((start, pos))
+    return cuts, pos, records
+
+
+def pack_samples(buf: bytes, limit: int = MAX_DATAGRAM_SIZE) -> Tuple[List[Tuple[int, int]], int, int]:
+    """Split raw -I output in buf into datagram-sized runs of whole samples
+    
+    hackrf_sweep -I writes bare interleaved float32 I/Q pairs with no
+    framing, so datagrams are cut on sample boundaries.
+    """
+    step = limit - limit % IFFT_SAMPLE_SIZE
+    end = len(buf) - len(buf) % IFFT_SAMPLE_SIZE
+    cuts = [(start, min(start + step, end)) for start in range(0, end, step)]
+    return cuts, end, end // IFFT_SAMPLE_SIZE
+
+
+def set_pipe_size(fd: int, size: int):
+    """Grow a pipe's kernel buffer with F_SETPIPE_SZ where Linux allows it"""
+    if not sys.platform.startswith('linux'):
+        return
+    import fcntl
+    setpipe = getattr(fcntl, 'F_SETPIPE_SZ', None)
+    if setpipe is None:
+        return
+    try:
+        fcntl.fcntl(fd, setpipe, size)
+    except OSError as e:
+        # Unprivileged processes cannot go beyond /proc/sys/fs/pipe-max-size
+        logger.debug("Could not resize pipe to %d bytes: %s", size, e)
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [('iov_base', ctypes.c_void_p), ('iov_len', ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_name', ctypes.c_void_p),
+        ('msg_namelen', ctypes.c_uint32),
+        ('msg_iov', ctypes.POINTER(_IOVec)),
+        ('msg_iovlen', ctypes.c_size_t),
+        ('msg_control', ctypes.c_void_p),
+        ('msg_controllen', ctypes.c_size_t),
+        ('msg_flags', ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [('msg_hdr', _MsgHdr), ('msg_len', ctypes.c_uint)]
+
+
+def _load_sendmmsg():
+    """Return libc's sendmmsg on Linux, or None elsewhere"""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        sendmmsg = libc.sendmmsg
+    except (OSError, AttributeError):
+        return None
+    sendmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint, ctypes.c_int]
+    sendmmsg.restype = ctypes.c_int
+    return sendmmsg
+
+
+_sendmmsg = _load_sendmmsg()
+
+
+class DatagramSender:
+    """Send stream datagrams to many addresses with few system calls
+    
+    On Linux every (datagram, subscriber) pair of a read is handed to one
+    sendmmsg(2) call on the transport's socket. Whatever sendmmsg cannot take
+    right away, and everything on other platforms or non-IPv4 sockets, goes
+    through transport.sendto so asyncio's buffering still applies.
+    """
+    
+    def __init__(self, transport: asyncio.DatagramTransport, capacity: int = 1024):
+        self.transport = transport
+        sock = transport.get_extra_info('socket')
+        self.fd = sock.fileno()
+        self.enabled = _sendmmsg is not None and sock.family == socket.AF_INET
+        self.capacity = capacity
+        self._msgs = (_MMsgHdr * capacity)()
+        self._iovecs = (_IOVec * capacity)()
+        for i in range(capacity):
+            self._msgs[i].msg_hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            self._msgs[i].msg_hdr.msg_iovlen = 1
+        self._sockaddrs: Dict[tuple, ctypes.Array] = {}
+    
+    def _sockaddr(self, address: tuple) -> ctypes.Array:
+        """Return a cached struct sockaddr_in for an (host, port) address"""
+        sockaddr = self._sockaddrs.get(address)
+        if sockaddr is None:
+            raw = struct.pack('=H', socket.AF_INET) + struct.pack('!H', address[1]) + socket.inet_aton(address[0])
+            sockaddr = ctypes.create_string_buffer(raw, 16)
+            self._sockaddrs[address] = sockaddr
+        return sockaddr
+    
+    def forget(self, address: tuple):
+        """Drop the cached socket address of a departed client"""
+        self._sockaddrs.pop(address, None)
+    
+    def send(self, buf: bytes, cuts: List[Tuple[int, int]], addresses: Collection[tuple]):
+        """Send buf[start:end] for every cut to every address"""
+        if not cuts or not addresses:
+            return
+        sent = 0
+        # Anything already queued in the transport must go out first
+        if self.enabled and not self.transport.get_write_buffer_size():
+            sent = self._sendmmsg(buf, cuts, addresses)
+        if sent == len(cuts) * len(addresses):
+            return
+        # Datagrams were queued cut by cut, address by address; resume there
+        index = 0
+        with memoryview(buf) as view:
+            for start, end in cuts:
+                datagram = view[start:end]
+                for address in addresses:
+                    if index >= sent:
+                        self.transport.sendto(datagram, address)
+                    index += 1
+    
+    def _sendmmsg(self, buf: bytes, cuts: List[Tuple[int, int]], addresses: Collection[tuple]) -> int:
+        """Send as many datagrams as the socket accepts; return how many"""
+        if isinstance(buf, bytes):
+            base = ctypes.cast(ctypes.c_char_p(buf), ctypes.c_void_p).value
+        else:
+            base = ctypes.addressof(ctypes.c_char.from_buffer(buf))
+        sockaddrs = [self._sockaddr(address) for address in addresses]
+        msgs = self._msgs
+        iovecs = self._iovecs
+        capacity = self.capacity
+        sent = 0
+        count = 0
+        for start, end in cuts:
+            for sockaddr in sockaddrs:
+                iovecs[count].iov_base = base + start
+                iovecs[count].iov_len = end - start
+                header = msgs[count].msg_hdr
+                header.msg_name = ctypes.addressof(sockaddr)
+                header.msg_namelen = 16
+                count += 1
+                if count == capacity:
+                    accepted = self._flush(count)
+                    sent += accepted
+                    if accepted < count:
+                        return sent
+                    count = 0
+        if count:
+            sent += self._flush(count)
+        return sent
+    
+    def _flush(self, count: int) -> int:
+        """Submit the first count prepared messages; return how many were sent"""
+        done = 0
+        while done < count:
+            result = _sendmmsg(self.fd, ctypes.byref(self._msgs[done]), count - done, socket.MSG_DONTWAIT)
+            if result <= 0:
+                # EAGAIN or a per-destination error: leave the rest to sendto
+                break
+            done += result
+        return done
+
+
+@dataclass(slots=True)
 class ClientInfo:
     """Information about connected clients"""
     address: tuple
     last_seen: float
     connected_at: float
-    hackrf_process: Optional[asyncio.subprocess.Process] = None
+    stream: Optional['StreamHub'] = None
     active_stream: bool = False
 
 
+@dataclass(eq=False)
+class StreamHub:
+    """One hackrf_sweep process whose output is fanned out to its subscribers"""
+    args: Tuple[str, ...]
+    process: subprocess.Popen
+    fd: int  # Non-blocking read end of the process's stdout pipe
+    pack: Callable[[bytes], Tuple[List[Tuple[int, int]], int, int]] = pack_lines  # Splits output into datagrams
+    subscribers: Dict[tuple, 'ClientInfo'] = field(default_factory=dict)  # Address -> client
+    task: Optional[asyncio.Task] = None
+    pending: bytearray = field(default_factory=bytearray)  # Partial line or record carried to the next read
+    finished: Optional[asyncio.Future] = None  # Resolved once the pipe reaches EOF
+    lines_sent: int = 0
+
+
+# freq_min:freq_max in MHz, each a plain decimal number
+_FREQ_RANGE_RE = re.compile(r'(\d+(?:\.\d+)?):(\d+(?:\.\d+)?)')
+
+
 class HackRFValidator:
     """Validates hackrf_sweep command line arguments based on the help output"""
     
     @staticmethod
     def validate_frequency_range(freq_str: str) -> bool:
         """Validate frequency range format (freq_min:freq_max)"""
-        try:
-            if ':' not in freq_str:
-                return False
-            freq_min, freq_max = freq_str.split(':')
-            freq_min_val = float(freq_min)
-            freq_max_val = float(freq_max)
-            return freq_min_val < freq_max_val and freq_min_val > 0
-        except (ValueError, TypeError):
+        if not isinstance(freq_str, str):
+            return False
+        match = _FREQ_RANGE_RE.fullmatch(freq_str)
+        if match is None:
             return False
+        freq_min_val = float(match.group(1))
+        return 0 < freq_min_val < float(match.group(2))
     
     @staticmethod
     def validate_gain(gain_str: str, min_val: int, max_val: int, step: int) -> bool:
@@ -91,148 +342,105 @@ class HackRFValidator:
     
     @classmethod
     def validate_hackrf_args(cls, args: List[str]) -> Tuple[bool, str, List[str]]:
-        """Validate hackrf_sweep arguments and return (valid, error_msg, processed_args)"""
+        """Validate hackrf_sweep arguments and return (valid, error_msg, processed_args)
+        
+        Results are cached per argument tuple, since clients tend to send the
+        same arguments again and again. Arguments from JSON can be any type,
+        so anything but strings is rejected before the cache sees it.
+        """
+        for arg in args:
+            if not isinstance(arg, str):
+                return False, f"Invalid argument: {arg!r} (arguments must be strings)", []
+        is_valid, error_msg, processed_args = cls._validate(tuple(args))
+        return is_valid, error_msg, list(processed_args)
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _validate(args: Tuple[str, ...]) -> Tuple[bool, str, Tuple[str, ...]]:
+        """Validate an argument tuple; memoized for validate_hackrf_args"""
         if not args:
-            return False, "No arguments provided", []
+            return False, "No arguments provided", ()
         
         processed_args = []
         i = 0
-        
-        while i < len(args):
+        count = len(args)
+        while i < count:
             arg = args[i]
+            spec = HACKRF_OPTIONS.get(arg)
+            if spec is None:
+                return False, f"Unknown hackrf_sweep option: {arg}", ()
             
-            # Help option
-            if arg == '-h':
-                processed_args.append(arg)
-                i += 1
-                continue
-            
-            # Serial number
-            elif arg == '-d':
-                if i + 1 >= len(args):
-                    return False, f"Option {arg} requires a serial number", []
-                processed_args.extend([arg, args[i + 1]])
-                i += 2
-            
-            # RX RF amplifier (0 or 1)
-            elif arg == '-a':
-                if i + 1 >= len(args):
-                    return False, f"Option {arg} requires a value (0 or 1)", []
-                if not cls.validate_amp_antenna_enable(args[i + 1]):
-                    return False, f"Invalid amp enable value: {args[i + 1]} (must be 0 or 1)", []
-                processed_args.extend([arg, args[i + 1]])
-                i += 2
-            
-            # Frequency range
-            elif arg == '-f':
-                if i + 1 >= len(args):
-                    return False, f"Option {arg} requires frequency range (freq_min:freq_max)", []
-                if not cls.validate_frequency_range(args[i + 1]):
-                    return False, f"Invalid frequency range: {args[i + 1]} (format: freq_min:freq_max in MHz)", []
-                processed_args.extend([arg, args[i + 1]])
-                i += 2
-            
-            # Antenna port power (0 or 1)
-            elif arg == '-p':
-                if i + 1 >= len(args):
-                    return False, f"Option {arg} requires a value (0 or 1)", []
-                if not cls.validate_amp_antenna_enable(args[i + 1]):
-                    return False, f"Invalid antenna enable value: {args[i + 1]} (must be 0 or 1)", []
-                processed_args.extend([arg, args[i + 1]])
-                i += 2
-            
-            # RX LNA gain (0-40dB, 8dB steps)
-            elif arg == '-l':
-                if i + 1 >= len(args):
-                    return False, f"Option {arg} requires LNA gain value (0-40dB, 8dB steps)", []
-                if not cls.validate_gain(args[i + 1], 0, 40, 8):
-                    return False, f"Invalid LNA gain: {args[i + 1]} (0-40dB, 8dB steps)", []
-                processed_args.extend([arg, args[i + 1]])
-                i += 2
-            
-            # RX VGA gain (0-62dB, 2dB steps)
-            elif arg == '-g':
-                if i + 1 >= len(args):
-                    return False, f"Option {arg} requires VGA gain value (0-62dB, 2dB steps)", []
-                if not cls.validate_gain(args[i + 1], 0, 62, 2):
-                    return False, f"Invalid VGA gain: {args[i + 1]} (0-62dB, 2dB steps)", []
-                processed_args.extend([arg, args[i + 1]])
-                i += 2
-            
-            # FFT bin width
-            elif arg == '-w':
-                if i + 1 >= len(args):
-                    return False, f"Option {arg} requires bin width (2445-5000000 Hz)", []
-                if not cls.validate_bin_width(args[i + 1]):
-                    return False, f"Invalid bin width: {args[i + 1]} (2445-5000000 Hz)", []
-                processed_args.extend([arg, args[i + 1]])
-                i += 2
+            requirement, validator, invalid = spec
             
-            # FFTW wisdom file
-            elif arg == '-W':
-                if i + 1 >= len(args):
-                    return False, f"Option {arg} requires wisdom file path", []
-                processed_args.extend([arg, args[i + 1]])
-                i += 2
-            
-            # FFTW plan type
-            elif arg == '-P':
-                if i + 1 >= len(args):
-                    return False, f"Option {arg} requires plan type", []
-                if not cls.validate_fftw_plan(args[i + 1]):
-                    return False, f"Invalid FFTW plan: {args[i + 1]} (estimate|measure|patient|exhaustive)", []
-                processed_args.extend([arg, args[i + 1]])
-                i += 2
-            
-            # One shot mode
-            elif arg == '-1':
-                processed_args.append(arg)
-                i += 1
-            
-            # Number of sweeps
-            elif arg == '-N':
-                if i + 1 >= len(args):
-                    return False, f"Option {arg} requires number of sweeps", []
-                if not cls.validate_num_sweeps(args[i + 1]):
-                    return False, f"Invalid number of sweeps: {args[i + 1]} (must be positive integer)", []
-                processed_args.extend([arg, args[i + 1]])
-                i += 2
-            
-            # Binary output
-            elif arg == '-B':
+            # Flags such as -h, -1, -B and -I take no value
+            if requirement is None:
                 processed_args.append(arg)
                 i += 1
+                continue
             
-            # Binary inverse FFT output
-            elif arg == '-I':
-                processed_args.append(arg)
-                i += 1
-            
-            # Output file
-            elif arg == '-r':
-                if i + 1 >= len(args):
-                    return False, f"Option {arg} requires output filename", []
-                processed_args.extend([arg, args[i + 1]])
-                i += 2
-            
-            else:
-                return False, f"Unknown hackrf_sweep option: {arg}", []
+            if i + 1 >= count:
+                return False, f"Option {arg} requires {requirement}", ()
+            value = args[i + 1]
+            if validator is not None and not validator(value):
+                return False, invalid.format(value), ()
+            processed_args.extend((arg, value))
+            i += 2
         
-        return True, "", processed_args
+        return True, "", tuple(processed_args)
+
+
+# hackrf_sweep options: flag -> (what the missing value is, validator, error
+# template for an invalid value). Flags without a value map to all None;
+# options with a free-form value have no validator.
+_FLAG = (None, None, None)
+HACKRF_OPTIONS = {
+    '-h': _FLAG,
+    '-d': ("a serial number", None, None),
+    '-a': ("a value (0 or 1)", HackRFValidator.validate_amp_antenna_enable,
+           "Invalid amp enable value: {} (must be 0 or 1)"),
+    '-f': ("frequency range (freq_min:freq_max)", HackRFValidator.validate_frequency_range,
+           "Invalid frequency range: {} (format: freq_min:freq_max in MHz)"),
+    '-p': ("a value (0 or 1)", HackRFValidator.validate_amp_antenna_enable,
+           "Invalid antenna enable value: {} (must be 0 or 1)"),
+    '-l': ("LNA gain value (0-40dB, 8dB steps)", partial(HackRFValidator.validate_gain, min_val=0, max_val=40, step=8),
+           "Invalid LNA gain: {} (0-40dB, 8dB steps)"),
+    '-g': ("VGA gain value (0-62dB, 2dB steps)", partial(HackRFValidator.validate_gain, min_val=0, max_val=62, step=2),
+           "Invalid VGA gain: {} (0-62dB, 2dB steps)"),
+    '-w': ("bin width (2445-5000000 Hz)", HackRFValidator.validate_bin_width,
+           "Invalid bin width: {} (2445-5000000 Hz)"),
+    '-W': ("wisdom file path", None, None),
+    '-P': ("plan type", HackRFValidator.validate_fftw_plan,
+           "Invalid FFTW plan: {} (estimate|measure|patient|exhaustive)"),
+    '-1': _FLAG,
+    '-N': ("number of sweeps", HackRFValidator.validate_num_sweeps,
+           "Invalid number of sweeps: {} (must be positive integer)"),
+    '-B': _FLAG,
+    '-I': _FLAG,
+    '-r': ("output filename", None, None),
+}
 
 
 class HackRFSweepServer:
     """Asynchronous UDP server for HackRF sweep streaming"""
     
-    def __init__(self, host: str = '0.0.0.0', port: int = 5000):
+    def __init__(self, host: str = '0.0.0.0', port: int = 5000, reuse_port: bool = False):
         self.host = host
         self.port = port
+        self.reuse_port = reuse_port  # Share the port with sibling worker processes
         self.clients: Dict[tuple, ClientInfo] = {}
         self.transport: Optional[asyncio.DatagramTransport] = None
+        self.sender: Optional[DatagramSender] = None
         self.protocol: Optional['HackRFProtocol'] = None
         self.running = False
         self.client_timeout = 300  # 5 minutes client timeout
-        self.stream_tasks: Dict[tuple, asyncio.Task] = {}  # Track streaming tasks per client
+        self.expiry_heap: List[Tuple[float, tuple]] = []  # (last_seen when pushed, address)
+        self.streams: Dict[Tuple[str, ...], StreamHub] = {}  # One hackrf_sweep per distinct args
+        self.starting: Dict[Tuple[str, ...], asyncio.Event] = {}  # Args whose process is being spawned
+        self.commands: asyncio.Queue = asyncio.Queue(maxsize=COMMAND_QUEUE_SIZE)
+        self.workers: List[asyncio.Task] = []
+        self.stopped = asyncio.Event()  # Set by stop_server, ends start_server
+        # Forking and reaping hackrf_sweep happen here, off the event loop
+        self.spawner = ThreadPoolExecutor(max_workers=2, thread_name_prefix='spawn')
         
     async def start_server(self):
         """Start the UDP server"""
@@ -242,134 +450,262 @@ class HackRFSweepServer:
         loop = asyncio.get_running_loop()
         self.transport, self.protocol = await loop.create_datagram_endpoint(
             lambda: HackRFProtocol(self),
-            local_addr=(self.host, self.port)
+            local_addr=(self.host, self.port),
+            reuse_port=self.reuse_port
         )
+        self.sender = DatagramSender(self.transport)
         
         # Start background tasks
         self.running = True
-        await asyncio.gather(
-            self.cleanup_clients(),
-            return_exceptions=True
-        )
+        self.workers = [asyncio.create_task(self.command_worker()) for _ in range(COMMAND_WORKERS)]
+        background = [
+            asyncio.create_task(self.cleanup_clients()),
+            asyncio.create_task(self.stream_heartbeat()),
+        ]
+        try:
+            # Serve until stop_server is done
+            await self.stopped.wait()
+        finally:
+            for task in background:
+                task.cancel()
     
     async def start_hackrf_stream_for_client(self, client_address: tuple, hackrf_args: list):
-        """Start a hackrf_sweep process for a specific client"""
+        """Subscribe a client to the hackrf_sweep stream for its arguments
+        
+        Clients asking for identical arguments share one process; a new
+        process is only started for arguments nobody is streaming yet.
+        """
         client_info = self.clients.get(client_address)
         if not client_info:
             return False, "Client not connected"
         
-        # Stop existing stream if any
+        key = tuple(hackrf_args)
+        if client_info.stream is not None and client_info.stream.args == key:
+            return True, "Stream already running"
+        
+        # Leave the current stream if any
         await self.stop_hackrf_stream_for_client(client_address)
         
+        # Another client may be spawning the same stream; wait for it so the
+        # process is shared rather than started twice
+        while (starting := self.starting.get(key)) is not None:
+            await starting.wait()
+        if self.clients.get(client_address) is not client_info:
+            return False, "Client not connected"
+        
+        hub = self.streams.get(key)
+        if hub is not None:
+            hub.subscribers[client_address] = client_info
+            client_info.stream = hub
+            client_info.active_stream = True
+            logger.info(f"Client {client_address} joined running stream ({len(hub.subscribers)} subscribers)")
+            return True, "Joined running stream"
+        
         cmd = ['hackrf_sweep'] + hackrf_args
         logger.info(f"Starting HackRF process for client {client_address}: {' '.join(cmd)}")
         
+        # stdout goes to a plain pipe that is read straight from the event
+        # loop, rather than through asyncio's StreamReader. The fork runs in
+        # the spawner pool, bypassing asyncio's child watcher.
+        read_fd, write_fd = os.pipe()
+        loop = asyncio.get_running_loop()
+        starting = self.starting[key] = asyncio.Event()
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            client_info.hackrf_process = process
-            client_info.active_stream = True
-            
-            # Start streaming task for this client
-            task = asyncio.create_task(
-                self.stream_hackrf_output_to_client(client_address, process)
+            process = await loop.run_in_executor(
+                self.spawner,
+                partial(subprocess.Popen, cmd, stdout=write_fd, stderr=subprocess.DEVNULL)
             )
-            self.stream_tasks[client_address] = task
-            
-            logger.info(f"HackRF process started successfully for client {client_address}")
-            return True, "Stream started successfully"
-            
         except Exception as e:
+            os.close(read_fd)
             logger.error(f"Failed to start HackRF process for client {client_address}: {e}")
             return False, f"Failed to start stream: {str(e)}"
+        finally:
+            os.close(write_fd)
+            # Waiting clients join the new hub, or try the spawn themselves
+            # if it failed
+            del self.starting[key]
+            starting.set()
+        
+        # The client may have disconnected while the process was starting;
+        # nobody would ever stop a hub registered for it
+        if self.clients.get(client_address) is not client_info:
+            logger.info(f"Client {client_address} left before its HackRF process started")
+            os.close(read_fd)
+            await self._stop_process(process)
+            return False, "Client not connected"
+        
+        os.set_blocking(read_fd, False)
+        set_pipe_size(read_fd, PIPE_BUFFER_SIZE)
+        
+        if '-B' in key:
+            pack = pack_frames
+        elif '-I' in key:
+            pack = pack_samples
+        else:
+            pack = pack_lines
+        hub = StreamHub(args=key, process=process, fd=read_fd, pack=pack)
+        hub.subscribers[client_address] = client_info
+        self.streams[key] = hub
+        client_info.stream = hub
+        client_info.active_stream = True
+        
+        # Start the task that fans the output out to the subscribers
+        hub.task = asyncio.create_task(self.stream_hackrf_output(hub))
+        
+        logger.info(f"HackRF process started successfully for client {client_address}")
+        return True, "Stream started successfully"
     
     async def stop_hackrf_stream_for_client(self, client_address: tuple):
-        """Stop hackrf_sweep process for a specific client"""
+        """Unsubscribe a client, stopping hackrf_sweep once nobody is left"""
         client_info = self.clients.get(client_address)
         if not client_info:
             return
         
-        # Cancel streaming task
-        if client_address in self.stream_tasks:
-            task = self.stream_tasks[client_address]
-            if not task.done():
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
-            del self.stream_tasks[client_address]
-        
-        # Stop process
-        if client_info.hackrf_process and client_info.hackrf_process.returncode is None:
-            client_info.hackrf_process.terminate()
-            try:
-                await asyncio.wait_for(client_info.hackrf_process.wait(), timeout=5.0)
-            except asyncio.TimeoutError:
-                client_info.hackrf_process.kill()
-                await client_info.hackrf_process.wait()
-        
-        client_info.hackrf_process = None
+        hub = client_info.stream
+        client_info.stream = None
         client_info.active_stream = False
+        if hub is None:
+            return
+        
+        hub.subscribers.pop(client_address, None)
+        self.sender.forget(client_address)
         logger.info(f"Stopped HackRF stream for client {client_address}")
+        if not hub.subscribers:
+            await self.close_stream(hub)
     
-    async def stream_hackrf_output_to_client(self, client_address: tuple, process: asyncio.subprocess.Process):
-        """Stream HackRF output to a specific client"""
-        logger.info(f"Starting to stream HackRF output to client {client_address}")
+    async def close_stream(self, hub: StreamHub):
+        """Stop a stream's fan-out task, which in turn stops its process"""
+        task = hub.task
+        if task is not None and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    
+    async def _end_stream(self, hub: StreamHub):
+        """Detach a finished stream from the server and its subscribers"""
+        if self.streams.get(hub.args) is hub:
+            del self.streams[hub.args]
+        for client_info in hub.subscribers.values():
+            if client_info.stream is hub:
+                client_info.stream = None
+                client_info.active_stream = False
+        hub.subscribers.clear()
+        
+        await self._stop_process(hub.process)
+        logger.info(f"Stopped HackRF process for {' '.join(hub.args)}")
+    
+    async def _stop_process(self, process: subprocess.Popen):
+        """Terminate a hackrf_sweep process, waiting for it in the spawner pool"""
+        loop = asyncio.get_running_loop()
+        if process.poll() is None:
+            process.terminate()
+            try:
+                await loop.run_in_executor(self.spawner, process.wait, 5.0)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                await loop.run_in_executor(self.spawner, process.wait)
+    
+    async def stream_hackrf_output(self, hub: StreamHub):
+        """Stream HackRF output to every subscriber of a hub
         
-        lines_sent = 0
-        last_status_time = time.time()
+        The pipe is drained by _drain_pipe whenever the event loop reports it
+        readable; this task only lives until the pipe reaches EOF or the
+        stream is closed, and then tears the stream down.
+        """
+        logger.info(f"Starting to stream HackRF output for {' '.join(hub.args)}")
+        
+        loop = asyncio.get_running_loop()
+        hub.finished = loop.create_future()
+        loop.add_reader(hub.fd, self._drain_pipe, hub)
         
         try:
-            while self.running and process.returncode is None:
-                # Read with timeout to avoid hanging
-                try:
-                    line = await asyncio.wait_for(process.stdout.readline(), timeout=1.0)
-                except asyncio.TimeoutError:
-                    # Check if client is still connected by updating last_seen
-                    if client_address in self.clients:
-                        current_time = time.time()
-                        # Log status every 30 seconds
-                        if current_time - last_status_time > 30:
-                            logger.info(f"Client {client_address}: Still streaming, {lines_sent} lines sent")
-                            last_status_time = current_time
-                    continue
-                
-                if not line:
-                    logger.info(f"HackRF process ended for client {client_address}")
-                    break
-                
-                # Send to specific client
-                try:
-                    self.transport.sendto(line, client_address)
-                    lines_sent += 1
-                    
-                    if client_address in self.clients:
-                        self.clients[client_address].last_seen = time.time()
-                        
-                    # Log progress every 1000 lines
-                    if lines_sent % 1000 == 0:
-                        logger.debug(f"Sent {lines_sent} lines to client {client_address}")
-                        
-                except Exception as e:
-                    logger.warning(f"Failed to send data to client {client_address}: {e}")
-                    # Don't break immediately, client might reconnect
-                    await asyncio.sleep(0.1)
-                
+            # Runs until the pipe reports EOF so output written just before
+            # the process exits is still delivered
+            await hub.finished
         except asyncio.CancelledError:
-            logger.info(f"HackRF output streaming cancelled for client {client_address} (sent {lines_sent} lines)")
+            logger.info(f"HackRF output streaming cancelled (sent {hub.lines_sent} lines)")
         except Exception as e:
-            logger.error(f"Error streaming HackRF output to client {client_address}: {e}")
+            logger.error(f"Error streaming HackRF output: {e}")
             import traceback
             logger.error(f"Traceback: {traceback.format_exc()}")
         finally:
-            logger.info(f"Finished streaming to client {client_address}, sent {lines_sent} lines total")
+            loop.remove_reader(hub.fd)
+            os.close(hub.fd)
+            logger.info(f"Finished streaming {' '.join(hub.args)}, sent {hub.lines_sent} lines total")
             # Clean up
-            await self.stop_hackrf_stream_for_client(client_address)
+            await self._end_stream(hub)
+    
+    def _drain_pipe(self, hub: StreamHub):
+        """Read one block from a hub's pipe and send it out as datagrams
+        
+        Complete lines (or -B records, or -I samples) are packed into
+        datagrams of up to MAX_DATAGRAM_SIZE bytes, so one send carries many
+        lines.
+        """
+        try:
+            chunk = os.read(hub.fd, PIPE_READ_SIZE)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as e:
+            asyncio.get_running_loop().remove_reader(hub.fd)
+            if not hub.finished.done():
+                hub.finished.set_exception(e)
+            return
+        
+        subscribers = hub.subscribers
+        pending = hub.pending
+        
+        if not chunk:
+            asyncio.get_running_loop().remove_reader(hub.fd)
+            # Forward whatever the process left without a final newline
+            if pending:
+                tail = bytes(pending)
+                cuts = [(start, min(start + MAX_DATAGRAM_SIZE, len(tail)))
+                        for start in range(0, len(tail), MAX_DATAGRAM_SIZE)]
+                self.sender.send(tail, cuts, subscribers)
+                pending.clear()
+            logger.info(f"HackRF process ended for {' '.join(hub.args)}")
+            if not hub.finished.done():
+                hub.finished.set_result(None)
+            return
+        
+        # Datagrams are sliced straight out of the block that was read; only
+        # a partial line left over from the previous read forces a copy into
+        # the carry-over buffer
+        if pending:
+            pending += chunk
+            buf = pending
+        else:
+            buf = chunk
+        cuts, consumed, lines = hub.pack(buf)
+        
+        # Send to every subscriber
+        try:
+            self.sender.send(buf, cuts, subscribers)
+            
+            current_time = time.time()
+            for client_info in subscribers.values():
+                client_info.last_seen = current_time
+            
+            # Log progress every 1000 lines
+            lines_sent = hub.lines_sent
+            if (lines_sent + lines) // 1000 > lines_sent // 1000:
+                logger.debug("Sent %d lines to %d client(s)", lines_sent + lines, len(subscribers))
+            hub.lines_sent = lines_sent + lines
+            
+        except Exception as e:
+            # Don't stop the stream, the client might reconnect
+            logger.warning("Failed to send data to subscribers: %s", e)
+        finally:
+            if buf is pending:
+                del pending[:consumed]
+            else:
+                pending += chunk[consumed:]
+            if len(pending) > MAX_PENDING_SIZE:
+                logger.warning("Dropping %d bytes of unframed output from %s", len(pending), ' '.join(hub.args))
+                pending.clear()
     
     def add_client(self, address: tuple):
         """Add a new client"""
@@ -380,6 +716,7 @@ class HackRFSweepServer:
                 last_seen=current_time,
                 connected_at=current_time
             )
+            heapq.heappush(self.expiry_heap, (current_time, address))
             logger.info(f"New client connected: {address}")
             logger.info(f"Total clients: {len(self.clients)}")
     
@@ -390,19 +727,37 @@ class HackRFSweepServer:
             logger.info(f"Client disconnected: {address}")
             logger.info(f"Total clients: {len(self.clients)}")
     
+    def expired_clients(self) -> List[tuple]:
+        """Pop the clients that have been silent for longer than client_timeout
+        
+        The heap holds one entry per client, keyed by last_seen as it was when
+        the entry was pushed. Only entries that look expired are examined: a
+        client seen since then is pushed back with its current last_seen, and
+        entries of clients that are gone, or that reconnected afterwards, are
+        dropped.
+        """
+        heap = self.expiry_heap
+        clients = self.clients
+        cutoff = time.time() - self.client_timeout
+        expired = []
+        while heap and heap[0][0] < cutoff:
+            pushed_at, address = heapq.heappop(heap)
+            client_info = clients.get(address)
+            if client_info is None or pushed_at < client_info.connected_at:
+                continue
+            if client_info.last_seen < cutoff:
+                expired.append(address)
+            else:
+                heapq.heappush(heap, (client_info.last_seen, address))
+        return expired
+    
     async def cleanup_clients(self):
         """Periodically cleanup inactive clients"""
         while self.running:
             try:
-                await asyncio.sleep(60)  # Check every minute
-                current_time = time.time()
-                inactive_clients = []
-                
-                for address, client_info in self.clients.items():
-                    if current_time - client_info.last_seen > self.client_timeout:
-                        inactive_clients.append(address)
-                
-                for address in inactive_clients:
+                await asyncio.sleep(10)  # Check every 10 seconds
+                for address in self.expired_clients():
+                    await self.stop_hackrf_stream_for_client(address)
                     self.remove_client(address)
                     logger.info(f"Removed inactive client: {address}")
                     
@@ -411,25 +766,63 @@ class HackRFSweepServer:
             except Exception as e:
                 logger.error(f"Error in client cleanup: {e}")
     
+    def submit_command(self, handler, *args) -> bool:
+        """Queue a control command coroutine for the workers
+        
+        Returns False when the queue is full and the command was dropped.
+        """
+        try:
+            self.commands.put_nowait((handler, args))
+        except asyncio.QueueFull:
+            return False
+        return True
+    
+    async def command_worker(self):
+        """Run queued control commands one at a time"""
+        while True:
+            handler, args = await self.commands.get()
+            try:
+                await handler(*args)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error running {handler.__name__}: {e}")
+            finally:
+                self.commands.task_done()
+    
+    async def stream_heartbeat(self):
+        """Log the progress of every running stream every 30 seconds"""
+        while self.running:
+            try:
+                await asyncio.sleep(30)
+                if logger.isEnabledFor(logging.INFO):
+                    for hub in self.streams.values():
+                        logger.info("%d client(s): Still streaming, %d lines sent", len(hub.subscribers), hub.lines_sent)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in stream heartbeat: {e}")
+    
     async def stop_server(self):
         """Stop the server gracefully"""
         logger.info("Stopping HackRF UDP server...")
         self.running = False
         
-        # Stop all client streams
-        for client_address in list(self.clients.keys()):
-            await self.stop_hackrf_stream_for_client(client_address)
+        for worker in self.workers:
+            worker.cancel()
         
-        # Cancel all remaining stream tasks
-        for task in self.stream_tasks.values():
-            if not task.done():
-                task.cancel()
+        # Stop all streams along with their processes
+        for hub in list(self.streams.values()):
+            await self.close_stream(hub)
+        
+        self.spawner.shutdown(wait=False)
         
         # Close transport
         if self.transport:
             self.transport.close()
         
         logger.info("Server stopped")
+        self.stopped.set()
     
     def get_server_stats(self) -> dict:
         """Get server statistics"""
@@ -437,8 +830,8 @@ class HackRFSweepServer:
         
         # Count active hackrf processes
         active_processes = 0
-        for client_info in self.clients.values():
-            if client_info.hackrf_process and client_info.hackrf_process.returncode is None:
+        for hub in self.streams.values():
+            if hub.process.poll() is None:
                 active_processes += 1
         
         return {
@@ -458,6 +851,41 @@ class HackRFSweepServer:
         }
 
 
+# Replies that never change are encoded once. The CONNECT reply only varies in
+# the client count, which replaces the "__CLIENTS__" placeholder.
+CONNECT_RESPONSE_TEMPLATE = json.dumps({
+    'status': 'connected',
+    'message': 'Successfully connected to HackRF server',
+    'server_info': {
+        'version': '2.0.0',
+        'clients': '__CLIENTS__'
+    },
+    'usage': {
+        'commands': {
+            'CONNECT': 'Connect to the server',
+            'START_STREAM': 'Start hackrf_sweep with options (plain arguments or JSON format)',
+            'STOP_STREAM': 'Stop current stream',
+            'STATS': 'Get server statistics',
+            'PING': 'Keep-alive ping',
+            'DISCONNECT': 'Disconnect from server'
+        },
+        'start_stream_format': {
+            'command': 'START_STREAM',
+            'args': ['-f', '88:108', '-g', '20', '-l', '16']
+        }
+    }
+}).encode('utf-8')
+
+UNKNOWN_COMMAND_RESPONSE = json.dumps({
+    'error': 'Unknown command',
+    'valid_commands': ['CONNECT', 'START_STREAM', 'STOP_STREAM', 'STATS', 'PING', 'DISCONNECT'],
+    'example_start_stream': {
+        'command': 'START_STREAM',
+        'args': ['-f', '88:108', '-g', '20', '-l', '16', '-w', '1000000']
+    }
+}).encode('utf-8')
+
+
 class HackRFProtocol(asyncio.DatagramProtocol):
     """UDP protocol handler for HackRF server"""
     
@@ -472,81 +900,63 @@ class HackRFProtocol(asyncio.DatagramProtocol):
     def datagram_received(self, data, addr):
         """Handle incoming datagrams from clients"""
         try:
-            message = data.decode('utf-8').strip()
+            # Commands are matched as bytes; only a START_STREAM payload is
+            # ever decoded
+            message = data.strip()
             
-            if message == "CONNECT":
+            if message == b"PING":
+                # Keep-alive ping from client
+                client_info = self.server.clients.get(addr)
+                if client_info is not None:
+                    client_info.last_seen = time.time()
+                self.transport.sendto(b"PONG", addr)
+                
+            elif message == b"CONNECT":
                 # Client wants to connect
                 self.server.add_client(addr)
-                response = json.dumps({
-                    'status': 'connected',
-                    'message': 'Successfully connected to HackRF server',
-                    'server_info': {
-                        'version': '2.0.0',
-                        'clients': len(self.server.clients)
-                    },
-                    'usage': {
-                        'commands': {
-                            'CONNECT': 'Connect to the server',
-                            'START_STREAM': 'Start hackrf_sweep with options (JSON format)',
-                            'STOP_STREAM': 'Stop current stream',
-                            'STATS': 'Get server statistics',
-                            'PING': 'Keep-alive ping',
-                            'DISCONNECT': 'Disconnect from server'
-                        },
-                        'start_stream_format': {
-                            'command': 'START_STREAM',
-                            'args': ['-f', '88:108', '-g', '20', '-l', '16']
-                        }
-                    }
-                }).encode('utf-8')
+                response = CONNECT_RESPONSE_TEMPLATE.replace(
+                    b'"__CLIENTS__"', str(len(self.server.clients)).encode('ascii')
+                )
                 self.transport.sendto(response, addr)
                 
-            elif message.startswith("START_STREAM"):
+            elif message.startswith(b"START_STREAM"):
                 # Client wants to start a stream with hackrf_sweep options
-                asyncio.create_task(self._handle_start_stream(message, addr))
+                self._submit(self._handle_start_stream, message, addr)
                 
-            elif message == "STOP_STREAM":
+            elif message == b"STOP_STREAM":
                 # Client wants to stop their stream
-                asyncio.create_task(self._handle_stop_stream(addr))
+                self._submit(self._handle_stop_stream, addr)
                 
-            elif message == "STATS":
+            elif message == b"STATS":
                 # Client requests server statistics
                 stats = self.server.get_server_stats()
                 response = json.dumps(stats, indent=2).encode('utf-8')
                 self.transport.sendto(response, addr)
                 
-            elif message == "PING":
-                # Keep-alive ping from client
-                if addr in self.server.clients:
-                    self.server.clients[addr].last_seen = time.time()
-                self.transport.sendto(b"PONG", addr)
-                
-            elif message == "DISCONNECT":
+            elif message == b"DISCONNECT":
                 # Client wants to disconnect
-                asyncio.create_task(self._handle_disconnect(addr))
+                self._submit(self._handle_disconnect, addr)
                 
             else:
                 # Unknown command
-                error_response = json.dumps({
-                    'error': 'Unknown command',
-                    'valid_commands': ['CONNECT', 'START_STREAM', 'STOP_STREAM', 'STATS', 'PING', 'DISCONNECT'],
-                    'example_start_stream': {
-                        'command': 'START_STREAM',
-                        'args': ['-f', '88:108', '-g', '20', '-l', '16', '-w', '1000000']
-                    }
-                }).encode('utf-8')
+                error_response = UNKNOWN_COMMAND_RESPONSE
                 self.transport.sendto(error_response, addr)
                 
         except Exception as e:
-            logger.error(f"Error handling datagram from {addr}: {e}")
+            logger.error("Error handling datagram from %s: %s", addr, e)
             error_response = json.dumps({
                 'error': f'Server error: {str(e)}'
             }).encode('utf-8')
             self.transport.sendto(error_response, addr)
     
+    def _submit(self, handler, *args):
+        """Hand a command to the server's workers, dropping it when they are swamped"""
+        if not self.server.submit_command(handler, *args):
+            logger.warning("Command queue full, dropped %s from %s", handler.__name__, args[-1])
+    
     def error_received(self, exc):
         """Handle protocol errors"""
-        logger.error(f"Protocol error: {exc}")
+        logger.error("Protocol error: %s", exc)
     
     def connection_lost(self, exc):
         """Called when the transport is closed"""
@@ -555,11 +965,11 @@ class HackRFProtocol(asyncio.DatagramProtocol):
         else:
             logger.info("Connection closed normally")
     
-    async def _handle_start_stream(self, message: str, addr: tuple):
+    async def _handle_start_stream(self, message: bytes, addr: tuple):
         """Handle START_STREAM command"""
         try:
             # Parse JSON payload from message
-            if message == "START_STREAM":
+            if message == b"START_STREAM":
                 # No arguments provided
                 error_response = json.dumps({
                     'error': 'START_STREAM requires arguments',
@@ -571,12 +981,17 @@ class HackRFProtocol(asyncio.DatagramProtocol):
                 self.transport.sendto(error_response, addr)
                 return
             
-            # Extract JSON payload
+            # Arguments come either as plain tokens (START_STREAM -f 88:108)
+            # or, for older clients, as a JSON payload
+            payload = message[len(b"START_STREAM"):].lstrip()
             try:
-                json_part = message[len("START_STREAM "):].strip()
-                request = json.loads(json_part)
-                hackrf_args = request.get('args', [])
-            except (json.JSONDecodeError, KeyError) as e:
+                if payload.startswith(b'{'):
+                    request = json.loads(payload)
+                    hackrf_args = request.get('args', [])
+                else:
+                    # Undecodable bytes become U+FFFD and fail validation
+                    hackrf_args = payload.decode('utf-8', 'replace').split()
+            except (json.JSONDecodeError, KeyError, UnicodeDecodeError) as e:
                 error_response = json.dumps({
                     'error': f'Invalid JSON format: {str(e)}',
                     'format': {
@@ -667,33 +1082,81 @@ class HackRFProtocol(asyncio.DatagramProtocol):
                 pass
 
 
-def validate_hackrf_args(args: list) -> list:
-    """Validate and process hackrf_sweep arguments"""
-    valid_args = []
-    i = 0
-    
-    while i < len(args):
-        arg = args[i]
+async def serve(args: argparse.Namespace, reuse_port: bool = False):
+    """Run one server until it is told to stop"""
+    try:
+        # Create and start server
+        server = HackRFSweepServer(args.host, args.port, reuse_port)
+        stopping = None
         
-        # Single character options that don't require values
-        if arg in ['-h', '-1', '-B', '-I']:
-            valid_args.append(arg)
-            i += 1
-            
-        # Options that require a value
-        elif arg in ['-d', '-a', '-f', '-p', '-l', '-g', '-w', '-W', '-P', '-N', '-r']:
-            if i + 1 < len(args):
-                valid_args.extend([arg, args[i + 1]])
-                i += 2
-            else:
-                raise ValueError(f"Option {arg} requires a value")
-        else:
-            raise ValueError(f"Unknown hackrf_sweep option: {arg}")
+        # Handle graceful shutdown
+        def signal_handler():
+            nonlocal stopping
+            logger.info("Received shutdown signal")
+            if stopping is None:
+                stopping = asyncio.create_task(server.stop_server())
+        
+        # Set up signal handlers
+        loop = asyncio.get_running_loop()
+        for sig in [signal.SIGTERM, signal.SIGINT]:
+            loop.add_signal_handler(sig, signal_handler)
+        
+        # Start the server (no hackrf_args needed - clients provide them)
+        await server.start_server()
+        
+    except KeyboardInterrupt:
+        logger.info("Received keyboard interrupt")
+    except Exception as e:
+        logger.error(f"Server error: {e}")
+        sys.exit(1)
+
+
+def run_worker(args: argparse.Namespace, cpu: int):
+    """Entry point of a worker process: pin it to a CPU and serve"""
+    try:
+        os.sched_setaffinity(0, {cpu})
+    except (AttributeError, OSError) as e:
+        logger.warning(f"Could not pin worker to CPU {cpu}: {e}")
+    try:
+        asyncio.run(serve(args, reuse_port=True))
+    except KeyboardInterrupt:
+        pass
+
+
+def run_workers(args: argparse.Namespace, count: int):
+    """Run count server processes sharing the port through SO_REUSEPORT
+    
+    The kernel spreads clients across the processes by their address, so
+    every datagram of a client reaches the same process. Each process keeps
+    its own clients and streams.
+    """
+    try:
+        cpus = sorted(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = list(range(os.cpu_count() or 1))
+    
+    logger.info(f"Starting {count} worker processes on {args.host}:{args.port}")
+    workers = [
+        multiprocessing.Process(target=run_worker, args=(args, cpus[i % len(cpus)]), name=f'worker-{i}')
+        for i in range(count)
+    ]
+    for worker in workers:
+        worker.start()
+    
+    # Pass shutdown signals on to the workers, which stop gracefully
+    def forward_signal(signum, frame):
+        for worker in workers:
+            if worker.is_alive():
+                os.kill(worker.pid, signum)
     
-    return valid_args
+    signal.signal(signal.SIGTERM, forward_signal)
+    signal.signal(signal.SIGINT, forward_signal)
+    
+    for worker in workers:
+        worker.join()
 
 
-async def main():
+def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(
         description='HackRF UDP Server - Stream hackrf_sweep output over UDP with client-provided options',
@@ -702,10 +1165,13 @@ async def main():
 Examples:
   python3 hackrf_udp_server.py --port 5000
   python3 hackrf_udp_server.py --host 0.0.0.0 --port 5000
+  python3 hackrf_udp_server.py --port 5000 --workers 0
 
 Client Protocol:
   1. Send "CONNECT" to connect to server
-  2. Send START_STREAM command with JSON payload:
+  2. Send START_STREAM followed by the hackrf_sweep arguments:
+     START_STREAM -f 88:108 -g 20 -l 16 -w 1000000
+     or with a JSON payload:
      START_STREAM {"args": ["-f", "88:108", "-g", "20", "-l", "16", "-w", "1000000"]}
   3. Receive hackrf_sweep output stream
   4. Send "STOP_STREAM" to stop current stream
@@ -722,6 +1188,9 @@ Other Commands:
                        help='Host IP to bind the server (default: 0.0.0.0)')
     parser.add_argument('--port', type=int, default=5000,
                        help='Port to bind the server (default: 5000)')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Server processes sharing the port via SO_REUSEPORT, each pinned to a CPU; '
+                            '0 starts one per CPU (default: 1)')
     parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
                        default='INFO', help='Logging level (default: INFO)')
     
@@ -731,33 +1200,16 @@ Other Commands:
     # Configure logging level
     logging.getLogger().setLevel(getattr(logging, args.log_level))
     
-    try:
-        # Create and start server
-        server = HackRFSweepServer(args.host, args.port)
-        
-        # Handle graceful shutdown
-        def signal_handler():
-            logger.info("Received shutdown signal")
-            asyncio.create_task(server.stop_server())
-        
-        # Set up signal handlers
-        loop = asyncio.get_running_loop()
-        for sig in [signal.SIGTERM, signal.SIGINT]:
-            loop.add_signal_handler(sig, signal_handler)
-        
-        # Start the server (no hackrf_args needed - clients provide them)
-        await server.start_server()
-        
-    except KeyboardInterrupt:
-        logger.info("Received keyboard interrupt")
-    except Exception as e:
-        logger.error(f"Server error: {e}")
-        sys.exit(1)
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    if workers == 1:
+        asyncio.run(serve(args))
+    else:
+        run_workers(args, workers)
 
 
 if __name__ == '__main__':
     try:
-        asyncio.run(main())
+        main()
     except KeyboardInterrupt:
         logger.info("Server shutdown requested")
     except Exception as e:
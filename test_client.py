@@ -3,72 +3,448 @@
 Simple test client for debugging HackRF UDP server connection issues
 """
 
-import socket
+import argparse
+import asyncio
+import ctypes
+import ctypes.util
+import errno
 import json
+import os
+import selectors
+import socket
+import struct
 import time
 import sys
 
-def test_client():
+# orjson is an optional speed-up; both parse replies straight from bytes
+try:
+    import orjson
+    
+    loads = orjson.loads
+    dumps = orjson.dumps
+except ImportError:
+    loads = json.loads
+    
+    def dumps(obj):
+        """Serialize obj to compact JSON bytes, matching orjson.dumps"""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+SERVER_ADDR = ("localhost", 5000)
+
+# Control messages, encoded once
+CONNECT = b"CONNECT"
+START_STREAM = b"START_STREAM "
+STOP_STREAM = b"STOP_STREAM"
+DISCONNECT = b"DISCONNECT"
+
+# The test streams the FM radio band
+FM_RADIO_ARGS = ["-f", "88:108", "-g", "20", "-l", "16", "-w", "1000000"]
+START_FM_RADIO = START_STREAM + dumps({"args": FM_RADIO_ARGS})
+
+# Socket buffer size requested so bursts are not dropped between reads. The
+# kernel caps it at net.core.rmem_max / net.core.wmem_max.
+DEFAULT_SOCKET_BUFFER = 12 * 1024 * 1024
+
+# Microseconds the kernel may busy-poll the NIC queue for this socket before
+# sleeping (SO_BUSY_POLL); 0 leaves interrupt-driven wake-ups alone
+DEFAULT_BUSY_POLL = 50
+# Not exported by the socket module; SO_PREFER_BUSY_POLL needs Linux 5.11+
+SO_BUSY_POLL = getattr(socket, "SO_BUSY_POLL", 46)
+SO_PREFER_BUSY_POLL = 69
+
+# Datagrams fetched per recvmmsg(2) call and the space reserved for each.
+# 64 KiB holds the largest UDP datagram and the largest GRO buffer, so
+# nothing is cut short; truncation is still detected and counted.
+RECV_BATCH = 64
+RECV_SIZE = 65536
+
+# With UDP_GRO the kernel may hand back many datagrams of one flow as a single
+# buffer, tagged with a control message holding the size of each segment
+UDP_GRO = 104
+
+# With SO_RXQ_OVFL the kernel reports, alongside received datagrams, how many
+# it has dropped on this socket because the receive buffer was full
+SO_RXQ_OVFL = getattr(socket, "SO_RXQ_OVFL", 40)
+
+# Room for the UDP_GRO and SO_RXQ_OVFL control messages of one datagram
+CONTROL_SIZE = 64
+_CMSG_HEADER = struct.Struct("@Nii")  # struct cmsghdr: cmsg_len, cmsg_level, cmsg_type
+_CMSG_ALIGN = ctypes.sizeof(ctypes.c_size_t) - 1
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+def _load_recvmmsg():
+    """Return libc's recvmmsg on Linux, or None elsewhere"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        recvmmsg = libc.recvmmsg
+    except (OSError, AttributeError):
+        return None
+    recvmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint, ctypes.c_int, ctypes.c_void_p]
+    recvmmsg.restype = ctypes.c_int
+    return recvmmsg
+
+_recvmmsg = _load_recvmmsg()
+
+class BatchReceiver:
+    """Read queued datagrams in batches with one recvmmsg(2) call
+    
+    All RECV_BATCH buffers live in one preallocated bytearray; receive()
+    returns the (start, end) span of each datagram in it, valid until the
+    next call. Without recvmmsg each call reads a single datagram into the
+    same buffer with recv_into, so no bytes object is ever allocated.
+    
+    truncated counts datagrams that did not fit their buffer, as flagged
+    by the kernel with MSG_TRUNC. With control=True every buffer also gets
+    room for control messages:
+    datagrams then counts the original datagrams inside coalesced UDP_GRO
+    buffers, and dropped holds the kernel's SO_RXQ_OVFL drop counter.
+    """
+    
+    def __init__(self, sock, batch=RECV_BATCH, size=RECV_SIZE, control=False):
+        self.sock = sock
+        self.batch = batch
+        self.size = size
+        self.control_enabled = control and _recvmmsg is not None
+        self.datagrams = 0
+        self.dropped = 0
+        self.truncated = 0
+        self.buffer = bytearray(batch * size)
+        self.view = memoryview(self.buffer)
+        base = ctypes.addressof(ctypes.c_char.from_buffer(self.buffer))
+        self.iovecs = (_IOVec * batch)()
+        self.msgs = (_MMsgHdr * batch)()
+        self.control = (ctypes.c_char * (batch * CONTROL_SIZE))()
+        control = ctypes.addressof(self.control)
+        for i in range(batch):
+            self.iovecs[i].iov_base = base + i * size
+            self.iovecs[i].iov_len = size
+            self.msgs[i].msg_hdr.msg_iov = ctypes.pointer(self.iovecs[i])
+            self.msgs[i].msg_hdr.msg_iovlen = 1
+            if self.control_enabled:
+                self.msgs[i].msg_hdr.msg_control = control + i * CONTROL_SIZE
+                self.msgs[i].msg_hdr.msg_controllen = CONTROL_SIZE
+    
+    def receive(self):
+        """Return the spans of the datagrams already queued, without waiting"""
+        if _recvmmsg is None:
+            try:
+                if hasattr(self.sock, "recvmsg_into"):
+                    nbytes, ancdata, flags, addr = self.sock.recvmsg_into([self.view[:self.size]])
+                    self.truncated += bool(flags & socket.MSG_TRUNC)
+                else:
+                    nbytes = self.sock.recv_into(self.view[:self.size])
+            except (BlockingIOError, InterruptedError):
+                return []
+            self.datagrams += 1
+            return [(0, nbytes)]
+        
+        fd = self.sock.fileno()
+        while True:
+            count = _recvmmsg(fd, self.msgs, self.batch, socket.MSG_DONTWAIT, None)
+            if count >= 0:
+                break
+            err = ctypes.get_errno()
+            if err == errno.EINTR:
+                continue
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK):
+                return []
+            raise OSError(err, os.strerror(err))
+        
+        size = self.size
+        msgs = self.msgs
+        datagrams = count
+        if self.control_enabled:
+            for i in range(count):
+                header = msgs[i].msg_hdr
+                # Control messages are rare (coalesced buffers, drops), so
+                # only those datagrams pay for parsing them
+                if header.msg_controllen:
+                    datagrams += self._parse_control(i, header.msg_controllen) - 1
+                # The kernel shrinks msg_controllen to what it wrote; restore it
+                header.msg_controllen = CONTROL_SIZE
+        self.datagrams += datagrams
+        spans = [(i * size, i * size + msgs[i].msg_len) for i in range(count)]
+        # Only a datagram that filled its buffer can have been truncated
+        for i, (start, end) in enumerate(spans):
+            if end - start == size and msgs[i].msg_hdr.msg_flags & socket.MSG_TRUNC:
+                self.truncated += 1
+        return spans
+    
+    def _parse_control(self, index, length):
+        """Read the control messages of buffer index; return its datagram count"""
+        segments = 1
+        control = self.control
+        offset = index * CONTROL_SIZE
+        end = offset + length
+        while offset + _CMSG_HEADER.size <= end:
+            cmsg_len, level, kind = _CMSG_HEADER.unpack_from(control, offset)
+            if cmsg_len < _CMSG_HEADER.size:
+                break
+            data = offset + _CMSG_HEADER.size
+            if level == socket.IPPROTO_UDP and kind == UDP_GRO:
+                gso_size, = struct.unpack_from("@i", control, data)
+                if gso_size:
+                    segments = -(-self.msgs[index].msg_len // gso_size)
+            elif level == socket.SOL_SOCKET and kind == SO_RXQ_OVFL:
+                # A running total for the socket, not a per-datagram count
+                self.dropped, = struct.unpack_from("@I", control, data)
+            offset += (cmsg_len + _CMSG_ALIGN) & ~_CMSG_ALIGN
+        return segments
+
+_decoder = json.JSONDecoder()
+
+class ReplyReader:
+    """Read JSON replies that may arrive split across several datagrams
+    
+    Datagrams are buffered until a whole document decodes; raw_decode reports
+    how much it consumed so anything after the document is kept for the next
+    reply.
+    """
+    
+    def __init__(self, sock):
+        self.sock = sock
+        self.pending = bytearray()
+    
+    def read(self):
+        """Return the next reply, receiving more datagrams until it is complete"""
+        while True:
+            reply = self._decode()
+            if reply is not None:
+                return reply
+            self.pending += self.sock.recv(RECV_SIZE)
+    
+    def _decode(self):
+        start = len(self.pending) - len(self.pending.lstrip())
+        if start == len(self.pending):
+            return None
+        if self.pending[start] not in b"{[":
+            raise ValueError(f"Not a JSON reply: {bytes(self.pending[:200])}")
+        
+        # Fast path: the buffer holds exactly one document (orjson when installed)
+        try:
+            reply = loads(self.pending)
+        except ValueError:
+            pass
+        else:
+            self.pending.clear()
+            return reply
+        
+        try:
+            text = self.pending[start:].decode("utf-8")
+            reply, end = _decoder.raw_decode(text)
+        except ValueError:
+            # Incomplete document or a UTF-8 sequence cut at a datagram boundary
+            return None
+        del self.pending[:start + len(text[:end].encode("utf-8"))]
+        return reply
+
+def set_buffer_size(sock, option, size, name, limit):
+    """Request a socket buffer size and report what the kernel granted"""
+    sock.setsockopt(socket.SOL_SOCKET, option, size)
+    # Linux reports double the usable size to account for bookkeeping
+    granted = sock.getsockopt(socket.SOL_SOCKET, option)
+    print(f"Socket {name} buffer: {granted} bytes")
+    if granted < size:
+        print(f"⚠️ Requested {size} bytes, raise net.core.{limit} to get it")
+
+def enable_busy_poll(sock, usec):
+    """Let the kernel busy-poll for this socket's packets instead of waiting for an interrupt
+    
+    Raising SO_BUSY_POLL needs CAP_NET_ADMIN; without it, set the
+    system-wide default instead: sysctl -w net.core.busy_read=50
+    """
+    if not usec:
+        return
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, SO_BUSY_POLL, usec)
+    except OSError as e:
+        print(f"⚠️ Busy polling not enabled ({e}); try sysctl -w net.core.busy_read={usec}")
+        return
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, SO_PREFER_BUSY_POLL, 1)
+    except OSError:
+        pass  # Older kernel, plain busy polling still applies
+    print(f"Busy polling for {usec} µs")
+
+def enable_gro(sock):
+    """Turn on UDP_GRO receive coalescing where the kernel supports it (Linux 5.0+)"""
+    if _recvmmsg is None:
+        return False
+    try:
+        sock.setsockopt(socket.IPPROTO_UDP, UDP_GRO, 1)
+    except OSError:
+        return False
+    return True
+
+def pin_to_cpu(sock, cpu):
+    """Run the client and deliver its packets on one CPU for repeatable measurements
+    
+    For the full effect, steer the NIC receive queue to the same core on the
+    host: ethtool -X <iface> to set up RSS, and irqbalance --banirq=<irq> so
+    the queue's interrupt stays put.
+    """
+    try:
+        os.sched_setaffinity(0, {cpu})
+    except (AttributeError, OSError) as e:
+        print(f"⚠️ Could not pin client to CPU {cpu}: {e}")
+        return
+    try:
+        # Let the kernel process this socket's packets on the same CPU
+        sock.setsockopt(socket.SOL_SOCKET, getattr(socket, "SO_INCOMING_CPU", 49), cpu)
+    except OSError as e:
+        print(f"⚠️ Could not set SO_INCOMING_CPU: {e}")
+    print(f"Pinned client to CPU {cpu}")
+
+def enable_drop_counter(sock):
+    """Have the kernel report receive-buffer drops with SO_RXQ_OVFL (Linux only)"""
+    if _recvmmsg is None:
+        return False
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, SO_RXQ_OVFL, 1)
+    except OSError:
+        return False
+    return True
+
+def drain(sock, receiver, seconds):
+    """Count the stream lines arriving on sock for the given number of seconds
+    
+    Returns (lines, samples, longest_gap): the line count, the first
+    datagrams as bytes for display, and the longest time in seconds
+    without data, including the wait for the first datagram.
+    This is the whole hot path of the test, kept in one call so it can be
+    profiled, or replaced by a native implementation, on its own.
+    """
+    buffer = receiver.buffer
+    
+    # One selector wait per burst; the socket is then drained
+    # without blocking
+    selector = selectors.DefaultSelector()
+    selector.register(sock, selectors.EVENT_READ)
+    sock.setblocking(False)
+    
+    # A monotonic deadline is immune to wall-clock adjustments
+    monotonic = time.monotonic
+    deadline = monotonic() + seconds
+    next_report = monotonic() + 1.0
+    last_data = monotonic()
+    longest_gap = 0.0
+    line_count = 0
+    samples = []
+    
+    # Methods used per burst or per datagram are looked up once
+    select = selector.select
+    receive = receiver.receive
+    count = buffer.count
+    batch = receiver.batch
+    
+    # Nothing is printed per datagram: the first lines are kept as
+    # samples and shown after the window, progress once a second.
+    # An empty wait is just an empty select() result; no timeout
+    # exception is raised, and receive() only runs when data is queued.
+    # Each wait ends at the next progress tick or the deadline, so
+    # neither drifts and the window closes on time even when idle.
+    while (now := monotonic()) < deadline:
+        if select(min(next_report, deadline) - now):
+            longest_gap = max(longest_gap, monotonic() - last_data)
+            while spans := receive():
+                # Samples are taken per batch, and only until there are five
+                if len(samples) < 5:
+                    samples += [bytes(buffer[start:end]) for start, end in spans if end > start][:5 - len(samples)]
+                
+                # The server packs several lines into one datagram; they are
+                # counted in place. An unterminated last line adds one, and
+                # & rather than `and` keeps this free of per-datagram branches
+                # (an empty datagram adds nothing)
+                for start, end in spans:
+                    line_count += count(b"\n", start, end) + ((end > start) & (buffer[end - 1] != 0x0A))
+                
+                # A short batch means the queue is empty
+                if len(spans) < batch:
+                    break
+            last_data = monotonic()
+        
+        if monotonic() >= next_report:
+            print(f"Received {line_count} lines so far...")
+            next_report += 1.0
+    
+    selector.close()
+    
+    return line_count, samples, max(longest_gap, deadline - last_data)
+
+def test_client(rcvbuf=DEFAULT_SOCKET_BUFFER, busy_poll=DEFAULT_BUSY_POLL, cpu=None, batch=RECV_BATCH):
     """Test the basic client connection and stream"""
     
     # Create UDP socket
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    set_buffer_size(sock, socket.SO_RCVBUF, rcvbuf, "receive", "rmem_max")
+    set_buffer_size(sock, socket.SO_SNDBUF, rcvbuf, "send", "wmem_max")
+    enable_busy_poll(sock, busy_poll)
+    gro = enable_gro(sock)
+    drop_counter = enable_drop_counter(sock)
+    if cpu is not None:
+        pin_to_cpu(sock, cpu)
     sock.settimeout(10.0)
     
-    server_addr = ('localhost', 5000)
+    server_addr = SERVER_ADDR
     
     try:
         print("🔗 Testing connection...")
         
+        # Fix the peer once; send/recv then skip per-call address handling
+        # and the kernel drops datagrams from anyone else
+        sock.connect(server_addr)
+        
         # Connect
-        sock.sendto(b"CONNECT", server_addr)
-        response, addr = sock.recvfrom(4096)
+        sock.send(CONNECT)
+        response = sock.recv(RECV_SIZE)
         print(f"✓ Connect response: {response.decode('utf-8')[:200]}...")
         
         # Start stream with basic FM radio args
         print("\n🎵 Starting FM radio stream...")
-        command = {
-            "args": ["-f", "88:108", "-g", "20", "-l", "16", "-w", "1000000"]
-        }
-        message = f"START_STREAM {json.dumps(command)}"
-        
-        sock.sendto(message.encode('utf-8'), server_addr)
-        response, addr = sock.recvfrom(4096)
-        
-        response_data = json.loads(response.decode('utf-8'))
+        sock.send(START_FM_RADIO)
+        response_data = ReplyReader(sock).read()
         if response_data.get('status') == 'stream_started':
             print("✓ Stream started successfully!")
             print(f"Args: {response_data.get('args', [])}")
             
             # Listen for data for 15 seconds
             print("\n📡 Listening for data for 15 seconds...")
-            sock.settimeout(2.0)
+            receiver = BatchReceiver(sock, batch, RECV_SIZE, gro or drop_counter)
+            line_count, samples, longest_gap = drain(sock, receiver, 15.0)
             
-            start_time = time.time()
-            line_count = 0
+            lines = b"".join(samples).decode('utf-8', errors='ignore').splitlines()
+            for number, line in enumerate(lines[:5], 1):
+                print(f"[{number:03d}] {line.strip()[:100]}...")
             
-            while time.time() - start_time < 15:
-                try:
-                    data, addr = sock.recvfrom(8192)
-                    line_count += 1
-                    
-                    if line_count <= 5:
-                        decoded = data.decode('utf-8', errors='ignore').strip()
-                        print(f"[{line_count:03d}] {decoded[:100]}...")
-                    elif line_count % 100 == 0:
-                        print(f"[{line_count:03d}] Received {line_count} lines so far...")
-                        
-                except socket.timeout:
-                    print(".", end="", flush=True)
-                    continue
-                    
-            print(f"\n📊 Total lines received: {line_count}")
+            print(f"\n📊 Total lines received: {line_count} in {receiver.datagrams} datagrams")
+            if drop_counter:
+                print(f"📉 Kernel-dropped packets: {receiver.dropped}")
+            print(f"✂️ Truncated datagrams: {receiver.truncated}")
+            print(f"⏳ Longest gap without data: {longest_gap:.2f} seconds")
             
             # Stop stream
             print("\n⏹️ Stopping stream...")
             sock.settimeout(10.0)
-            sock.sendto(b"STOP_STREAM", server_addr)
-            response, addr = sock.recvfrom(4096)
+            sock.send(STOP_STREAM)
+            response = sock.recv(RECV_SIZE)
             print(f"Stop response: {response.decode('utf-8')}")
             
         else:
@@ -77,8 +453,8 @@ def test_client():
             
         # Disconnect
         print("\n👋 Disconnecting...")
-        sock.sendto(b"DISCONNECT", server_addr)
-        response, addr = sock.recvfrom(1024)
+        sock.send(DISCONNECT)
+        response = sock.recv(RECV_SIZE)
         print(f"Disconnect response: {response}")
         
         return True
@@ -92,11 +468,117 @@ def test_client():
     finally:
         sock.close()
 
+class StreamCounter(asyncio.DatagramProtocol):
+    """One test client on a shared event loop: sends commands and counts stream lines"""
+    
+    def __init__(self):
+        self.transport = None
+        self.reply = None  # Future for the reply to the pending command
+        self.lines = 0
+        self.datagrams = 0
+    
+    def connection_made(self, transport):
+        self.transport = transport
+    
+    def datagram_received(self, data, addr):
+        # Command replies are JSON objects or DISCONNECTED; the rest is stream data
+        if data[:1] == b"{" or data == b"DISCONNECTED":
+            if self.reply is not None and not self.reply.done():
+                self.reply.set_result(data)
+            return
+        if data:
+            self.datagrams += 1
+            self.lines += data.count(b"\n") + (data[-1] != 0x0A)
+    
+    def error_received(self, exc):
+        if self.reply is not None and not self.reply.done():
+            self.reply.set_exception(exc)
+    
+    async def request(self, message, timeout=10.0):
+        """Send a command and wait for its reply"""
+        self.reply = asyncio.get_running_loop().create_future()
+        self.transport.sendto(message)
+        try:
+            return await asyncio.wait_for(self.reply, timeout)
+        finally:
+            self.reply = None
+
+async def run_clients(count, rcvbuf=DEFAULT_SOCKET_BUFFER, seconds=15.0):
+    """Stream the FM band to count clients at once from one event loop"""
+    loop = asyncio.get_running_loop()
+    clients = []
+    try:
+        for _ in range(count):
+            transport, client = await loop.create_datagram_endpoint(StreamCounter, remote_addr=SERVER_ADDR)
+            transport.get_extra_info("socket").setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf)
+            clients.append(client)
+        
+        print(f"🔗 Connecting {count} clients and starting their streams...")
+        for client in clients:
+            await client.request(CONNECT)
+        replies = await asyncio.gather(*(client.request(START_FM_RADIO) for client in clients))
+        failed = [reply for reply in replies if loads(reply).get("status") != "stream_started"]
+        if failed:
+            print(f"✗ {len(failed)} stream(s) failed to start: {failed[0][:200]}")
+            return False
+        
+        print(f"\n📡 Listening for data for {seconds:g} seconds...")
+        stop = asyncio.Event()
+        loop.call_later(seconds, stop.set)
+        await stop.wait()
+        
+        for number, client in enumerate(clients, 1):
+            print(f"[{number:03d}] {client.lines} lines in {client.datagrams} datagrams")
+        print(f"\n📊 Total lines received: {sum(client.lines for client in clients)}")
+        
+        print("\n⏹️ Stopping streams and disconnecting...")
+        await asyncio.gather(*(client.request(STOP_STREAM) for client in clients))
+        await asyncio.gather(*(client.request(DISCONNECT) for client in clients))
+        return True
+        
+    except Exception as e:
+        print(f"✗ Error: {e}")
+        import traceback
+        print(f"Traceback: {traceback.format_exc()}")
+        return False
+        
+    finally:
+        for client in clients:
+            client.transport.close()
+
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="HackRF UDP Server Test Client")
+    parser.add_argument("--rcvbuf", type=int, default=DEFAULT_SOCKET_BUFFER,
+                        help=f"Socket buffer size in bytes, for every client with --clients (default: {DEFAULT_SOCKET_BUFFER})")
+    parser.add_argument("--busy-poll", type=int, metavar="USEC",
+                        help=f"SO_BUSY_POLL time in microseconds, 0 to disable (default: {DEFAULT_BUSY_POLL}); "
+                             "needs CAP_NET_ADMIN or sysctl -w net.core.busy_read=USEC. Single client only")
+    parser.add_argument("--cpu", type=int,
+                        help="Pin the client and its socket to this CPU (Linux only). Single client only")
+    parser.add_argument("--batch", type=int,
+                        help=f"Datagrams read per recvmmsg call (default: {RECV_BATCH}). Single client only")
+    parser.add_argument("--clients", type=int, default=1,
+                        help="Run this many clients at once on one asyncio event loop (default: 1); "
+                             "only --rcvbuf applies to them")
+    args = parser.parse_args()
+    
+    # The asyncio clients read one datagram per callback on their own sockets,
+    # so the single client's receive-path tuning would silently not apply
+    if args.clients > 1:
+        single_only = [flag for flag, value in (("--busy-poll", args.busy_poll), ("--cpu", args.cpu),
+                                                ("--batch", args.batch)) if value is not None]
+        if single_only:
+            parser.error(f"{', '.join(single_only)} cannot be combined with --clients")
+    
     print("🧪 HackRF UDP Server Test Client")
     print("=" * 40)
     
-    success = test_client()
+    if args.clients > 1:
+        success = asyncio.run(run_clients(args.clients, args.rcvbuf))
+    else:
+        busy_poll = DEFAULT_BUSY_POLL if args.busy_poll is None else args.busy_poll
+        batch = RECV_BATCH if args.batch is None else args.batch
+        success = test_client(args.rcvbuf, busy_poll, args.cpu, batch)
     
     print("\n" + "=" * 40)
     if success: